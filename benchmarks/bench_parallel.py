@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Benchmark how KanjiConv.convert_many scales with the number of worker processes.
+
+Run with: python benchmarks/bench_parallel.py --max-workers 8 --texts 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from kanjiconv import KanjiConv
+
+SAMPLE_TEXTS = [
+    "幽☆遊☆白書は、最高の漫画デス。",
+    "東京駅から新幹線に乗って京都へ行く。",
+    "激を飛ばす監督の声が球場に響いた。",
+    "明日の天気は晴れのち曇り、所により雨でしょう。",
+    "吾輩は猫である。名前はまだ無い。",
+]
+
+
+def run(texts: list[str], workers: int, chunksize: int) -> float:
+    kanji_conv = KanjiConv()
+    start = time.perf_counter()
+    for _ in kanji_conv.convert_many(texts, modes=["roman"], workers=workers, chunksize=chunksize):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--texts", type=int, default=20000, help="Number of texts to convert.")
+    parser.add_argument("--chunksize", type=int, default=256)
+    args = parser.parse_args()
+
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] + str(i) for i in range(args.texts)]
+
+    baseline = None
+    print(f"{'workers':>7}  {'seconds':>8}  {'texts/s':>9}  {'speedup':>7}")
+    for workers in range(1, args.max_workers + 1):
+        elapsed = run(texts, workers, args.chunksize)
+        baseline = baseline or elapsed
+        print(f"{workers:>7}  {elapsed:>8.2f}  {len(texts) / elapsed:>9.0f}  {baseline / elapsed:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
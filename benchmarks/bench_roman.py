@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the katakana to romaji pass used by KanjiConv.to_roman.
+
+Compares the previous character-by-character loop with the precompiled transducer on
+documents of increasing length. Run with: python benchmarks/bench_roman.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from kanjiconv.kanjiconv import _get_romaji_transducer, _load_kana
+
+SAMPLE = "ユウユウハクショ ハ 、 サイコウ ノ マンガ デス 。 キョウ ハ ガッコウ デ コーヒー ヲ ノム 。 "
+
+
+def legacy_to_roman(kana: dict, text: str) -> str:
+    """The character-by-character implementation that the transducer replaced."""
+    roman_text = ""
+    i = 0
+    while i < len(text):
+        if i + 1 < len(text) and text[i] in kana["full_katakana"] and text[i + 1] in kana["small_katakana"]:
+            combined = text[i] + text[i + 1]
+            if combined in kana["katakana2roman"]:
+                roman_text += kana["katakana2roman"][combined]
+                i += 2
+                continue
+        char = text[i]
+        if "ァ" <= char <= "ン" or "、" <= char <= "ー":
+            roman_text += kana["katakana2roman"].get(char, "")
+        else:
+            roman_text += char
+        i += 1
+    return roman_text
+
+
+def main() -> None:
+    kana = _load_kana()
+    transducer = _get_romaji_transducer()
+
+    print(f"{'chars':>9}  {'legacy MB/s':>11}  {'transducer MB/s':>15}  {'speedup':>7}")
+    for repeat in (10, 100, 1000, 10000):
+        text = SAMPLE * repeat
+        number = max(1, 20000 // repeat)
+        legacy = min(timeit.repeat(lambda: legacy_to_roman(kana, text), number=number, repeat=3)) / number
+        current = min(timeit.repeat(lambda: transducer(text), number=number, repeat=3)) / number
+        size = len(text.encode("utf-8")) / 1e6
+        print(f"{len(text):>9}  {size / legacy:>11.2f}  {size / current:>15.2f}  {legacy / current:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
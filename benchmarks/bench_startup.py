@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Measure kanjiconv cold-start time.
+
+Reports the cumulative `python -X importtime` cost of importing the package and the CLI, and
+the wall time of short-lived CLI invocations. With --max-import-ms, exits non-zero when the
+CLI import exceeds the budget, so it can guard against startup regressions in CI.
+
+Run with: python benchmarks/bench_startup.py [--runs 10] [--max-import-ms 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of module in a fresh interpreter, in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | imported package".
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def wall_time_ms(args: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float, default=None, help="Fail if importing kanjiconv.cli is slower.")
+    args = parser.parse_args()
+
+    results = {
+        "import kanjiconv": [import_time_ms("kanjiconv") for _ in range(args.runs)],
+        "import kanjiconv.cli": [import_time_ms("kanjiconv.cli") for _ in range(args.runs)],
+        "kanjiconv --version": [wall_time_ms(["-m", "kanjiconv.cli", "--version"]) for _ in range(args.runs)],
+        "kanjiconv --help": [wall_time_ms(["-m", "kanjiconv.cli", "--help"]) for _ in range(args.runs)],
+    }
+    for name, timings in results.items():
+        print(f"{name:<22} median {statistics.median(timings):7.1f} ms  min {min(timings):7.1f} ms")
+
+    if args.max_import_ms is not None:
+        median = statistics.median(results["import kanjiconv.cli"])
+        if median > args.max_import_ms:
+            print(f"import kanjiconv.cli took {median:.1f} ms, budget is {args.max_import_ms:.1f} ms", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
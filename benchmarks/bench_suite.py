@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Benchmark every kanjiconv conversion path and configuration, with JSON output for comparing runs.
+
+Covers each to_* method, each sudachi_split_mode, custom readings on and off, UniDic on and off
+(skipped when the "unidic" extra is not installed) and startup, on the bundled sample corpus
+and on seeded synthetic corpora of varied length and kanji density.
+
+Run with: python benchmarks/bench_suite.py --output results.json
+Compare:  python benchmarks/bench_suite.py --output new.json --compare results.json --max-slowdown 1.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bench_startup import import_time_ms, wall_time_ms
+
+from kanjiconv import KanjiConv
+from kanjiconv.kanjiconv import UNIDIC_AVAILABLE
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+
+# Building blocks for synthetic text: kanji words, kana words and punctuation.
+KANJI_WORDS = ["東京", "新幹線", "天気", "最高", "漫画", "監督", "球場", "学校", "経済", "対策", "政府", "売上", "手続", "名前", "記憶"]
+KANA_WORDS = ["は", "の", "を", "に", "で", "と", "から", "です", "ます", "コーヒー", "ラーメン", "ちょっと", "とても", "ニャー"]
+PUNCTUATION = ["、", "。", "！", "？"]
+
+SYNTHETIC_LENGTHS = {"short": 20, "medium": 200, "long": 2000}
+SYNTHETIC_DENSITIES = {"low": 0.15, "mid": 0.4, "high": 0.7}
+
+
+def synthetic_text(length: int, kanji_density: float, rng: random.Random) -> str:
+    """Text of about length characters where roughly kanji_density of the words are kanji words."""
+    pieces = []
+    size = 0
+    while size < length:
+        if rng.random() < 0.1:
+            piece = rng.choice(PUNCTUATION)
+        elif rng.random() < kanji_density:
+            piece = rng.choice(KANJI_WORDS)
+        else:
+            piece = rng.choice(KANA_WORDS)
+        pieces.append(piece)
+        size += len(piece)
+    return "".join(pieces)[:length]
+
+
+def load_corpora(seed: int, texts_per_corpus: int) -> dict:
+    """Bundled sample corpus plus one synthetic corpus per length and kanji density."""
+    corpora = {"sample": (CORPUS_DIR / "sample_ja.txt").read_text(encoding="utf-8").splitlines()}
+    rng = random.Random(seed)
+    for length_name, length in SYNTHETIC_LENGTHS.items():
+        # Keep the total amount of text per corpus comparable across lengths.
+        count = max(1, texts_per_corpus * SYNTHETIC_LENGTHS["short"] // length)
+        for density_name, density in SYNTHETIC_DENSITIES.items():
+            texts = [synthetic_text(length, density, rng) for _ in range(count)]
+            corpora[f"synthetic-{length_name}-{density_name}"] = texts
+    return corpora
+
+
+def time_conversion(convert, texts: list[str], runs: int) -> list[float]:
+    convert(texts[0])  # Warm up: load dictionaries and build lazy indexes outside the timing.
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for text in texts:
+            convert(text)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def conversion_cases(corpora: dict) -> list[tuple]:
+    """(name, group, KanjiConv kwargs, method, corpus name) for every benchmarked configuration."""
+    cases = []
+    for method in ("to_hiragana", "to_katakana", "to_roman"):
+        for corpus in corpora:
+            cases.append((f"method/{method}/{corpus}", "method", {}, method, corpus))
+    for split_mode in ("A", "B", "C"):
+        settings = {"sudachi_split_mode": split_mode}
+        cases.append((f"split_mode/{split_mode}", "split_mode", settings, "to_roman", "sample"))
+    for enabled in (True, False):
+        state = "on" if enabled else "off"
+        settings = {"use_custom_readings": enabled}
+        cases.append((f"custom_readings/{state}", "custom_readings", settings, "to_roman", "sample"))
+        cases.append((f"unidic/{state}", "unidic", {"use_unidic": enabled}, "to_roman", "sample"))
+    return cases
+
+
+def run_conversion_cases(corpora: dict, runs: int, name_filter: str | None) -> list[dict]:
+    results = []
+    for name, group, kwargs, method, corpus in conversion_cases(corpora):
+        if name_filter and name_filter not in name:
+            continue
+        texts = corpora[corpus]
+        result = {"name": name, "group": group, "params": {**kwargs, "method": method, "corpus": corpus}}
+        if kwargs.get("use_unidic") and not UNIDIC_AVAILABLE:
+            result["skipped"] = 'UniDic is not installed (pip install "kanjiconv[unidic]")'
+            results.append(result)
+            print(f"{name:<45} skipped")
+            continue
+
+        convert = getattr(KanjiConv(**kwargs), method)
+        timings = time_conversion(convert, texts, runs)
+        median = statistics.median(timings)
+        chars = sum(map(len, texts))
+        result.update(
+            texts=len(texts),
+            chars=chars,
+            runs=runs,
+            timings_s=timings,
+            median_s=median,
+            min_s=min(timings),
+            chars_per_s=chars / median if median else None,
+        )
+        results.append(result)
+        print(f"{name:<45} median {median * 1000:9.2f} ms  {result['chars_per_s'] or 0:12.0f} chars/s")
+    return results
+
+
+def run_startup_cases(runs: int, name_filter: str | None) -> list[dict]:
+    def first_conversion_ms() -> float:
+        code = "from kanjiconv import KanjiConv; KanjiConv().to_roman('東京')"
+        return wall_time_ms(["-c", code])
+
+    cases = {
+        "startup/import kanjiconv": lambda: import_time_ms("kanjiconv"),
+        "startup/import kanjiconv.cli": lambda: import_time_ms("kanjiconv.cli"),
+        "startup/kanjiconv --version": lambda: wall_time_ms(["-m", "kanjiconv.cli", "--version"]),
+        "startup/first conversion": first_conversion_ms,
+    }
+    results = []
+    for name, measure in cases.items():
+        if name_filter and name_filter not in name:
+            continue
+        timings = [measure() / 1000 for _ in range(runs)]
+        median = statistics.median(timings)
+        results.append(
+            {
+                "name": name,
+                "group": "startup",
+                "params": {},
+                "runs": runs,
+                "timings_s": timings,
+                "median_s": median,
+                "min_s": min(timings),
+            }
+        )
+        print(f"{name:<45} median {median * 1000:9.2f} ms")
+    return results
+
+
+def metadata(args: argparse.Namespace) -> dict:
+    from importlib import metadata as importlib_metadata
+
+    def version(package: str) -> str | None:
+        try:
+            return importlib_metadata.version(package)
+        except importlib_metadata.PackageNotFoundError:
+            return None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "versions": {
+            package: version(package) for package in ("kanjiconv", "sudachipy", "sudachidict_full", "fugashi", "unidic")
+        },
+        "runs": args.runs,
+        "seed": args.seed,
+        "texts_per_corpus": args.texts_per_corpus,
+    }
+
+
+def compare(results: list[dict], baseline_path: str, max_slowdown: float | None) -> int:
+    """Print the median-time ratio against a previous run; return 1 if any case exceeds max_slowdown."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+
+    print(f"\n{'benchmark':<45} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    status = 0
+    for result in results:
+        previous = baseline.get(result["name"])
+        if "median_s" not in result or not previous or "median_s" not in previous:
+            continue
+        ratio = result["median_s"] / previous["median_s"]
+        flag = ""
+        if max_slowdown is not None and ratio > max_slowdown:
+            flag = "  SLOWER"
+            status = 1
+        before, after = previous["median_s"] * 1000, result["median_s"] * 1000
+        print(f"{result['name']:<45} {before:8.2f}ms {after:8.2f}ms {ratio:6.2f}x{flag}")
+    return status
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Timed repetitions per benchmark.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpora.")
+    parser.add_argument(
+        "--texts-per-corpus",
+        type=int,
+        default=200,
+        help="Number of short synthetic texts; longer corpora hold the same amount of text.",
+    )
+    parser.add_argument("--filter", metavar="SUBSTRING", help="Only run benchmarks whose name contains SUBSTRING.")
+    parser.add_argument("--no-startup", action="store_true", help="Skip the startup benchmarks.")
+    parser.add_argument("-o", "--output", metavar="PATH", help="Write results as JSON to PATH.")
+    parser.add_argument("--compare", metavar="PATH", help="JSON results of a previous run to compare against.")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=None,
+        help="With --compare, exit non-zero if any median is slower by more than this factor.",
+    )
+    args = parser.parse_args()
+
+    corpora = load_corpora(args.seed, args.texts_per_corpus)
+    results = run_conversion_cases(corpora, args.runs, args.filter)
+    if not args.no_startup:
+        results += run_startup_cases(args.runs, args.filter)
+
+    # Compare before writing, so --output may overwrite the baseline file.
+    status = compare(results, args.compare, args.max_slowdown) if args.compare else 0
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": metadata(args), "results": results}, f, ensure_ascii=False, indent=2)
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
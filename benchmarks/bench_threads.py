@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark how one shared KanjiConv instance scales with the number of threads.
+
+Every thread gets its own Sudachi tokenizer, so on a free-threaded build (python3.14t) throughput
+should grow with threads; with the GIL enabled it shows how much the tokenizer releases it.
+
+Run with: python benchmarks/bench_threads.py --max-threads 8 --texts 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from kanjiconv import KanjiConv
+
+SAMPLE_TEXTS = [
+    "幽☆遊☆白書は、最高の漫画デス。",
+    "東京駅から新幹線に乗って京都へ行く。",
+    "激を飛ばす監督の声が球場に響いた。",
+    "明日の天気は晴れのち曇り、所により雨でしょう。",
+    "吾輩は猫である。名前はまだ無い。",
+]
+
+
+def run(kanji_conv: KanjiConv, texts: list[str], threads: int) -> float:
+    chunks = [texts[i::threads] for i in range(threads)]
+
+    def convert(chunk: list[str]) -> None:
+        for text in chunk:
+            kanji_conv.to_roman(text)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        # Create every thread's tokenizer before timing.
+        list(pool.map(convert, [[SAMPLE_TEXTS[0]]] * threads))
+        start = time.perf_counter()
+        list(pool.map(convert, chunks))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--texts", type=int, default=20000, help="Number of texts to convert.")
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"Python {sys.version.split()[0]}, free-threaded build: {free_threaded_build}, GIL enabled: {gil_enabled}")
+
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] + str(i) for i in range(args.texts)]
+    kanji_conv = KanjiConv()
+
+    baseline = None
+    print(f"{'threads':>7}  {'seconds':>8}  {'texts/s':>9}  {'speedup':>7}")
+    for threads in range(1, args.max_threads + 1):
+        elapsed = run(kanji_conv, texts, threads)
+        baseline = baseline or elapsed
+        print(f"{threads:>7}  {elapsed:>8.2f}  {len(texts) / elapsed:>9.0f}  {baseline / elapsed:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark the UniDic fallback on unknown-word-heavy text: one tagger call per token vs. per document.
+
+Tokens that Sudachi cannot read (names, slang, rare kanji) are looked up in UniDic. Previously each
+of them cost a separate tagger call; now a document's unknown surfaces are resolved with one call.
+The UniDic memo is disabled so every lookup reaches the tagger. Requires the "unidic" extra.
+
+Run with: python benchmarks/bench_unidic.py --texts 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from kanjiconv import KanjiConv
+from kanjiconv.kanjiconv import UNIDIC_AVAILABLE
+
+# Unknown-word-heavy building blocks: rare names, slang and variant kanji, glued with common words.
+UNKNOWN_WORDS = [
+    "ぴえん", "エモい", "草生える", "鬱くしい", "㐂", "髙橋", "﨑山", "ワンチャン", "ガチ勢", "ぽよ", "卍", "激おこ", "檄", "斎藤", "齋藤"
+]
+COMMON_WORDS = ["は", "の", "を", "に", "と", "から", "です", "今日", "友達", "さん", "が", "言った"]
+PUNCTUATION = ["、", "。"]
+
+
+def unknown_heavy_text(words: int, rng: random.Random) -> str:
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(UNKNOWN_WORDS) if rng.random() < 0.5 else rng.choice(COMMON_WORDS))
+        if rng.random() < 0.1:
+            parts.append(rng.choice(PUNCTUATION))
+    return "".join(parts) + "。"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=2000, help="Number of documents.")
+    parser.add_argument("--words", type=int, default=30, help="Words per document.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not UNIDIC_AVAILABLE:
+        parser.error('UniDic is not installed; install the "unidic" extra and run "python -m unidic download".')
+
+    rng = random.Random(args.seed)
+    texts = [unknown_heavy_text(args.words, rng) for _ in range(args.texts)]
+
+    # The surfaces each document sends to UniDic: tokens whose Sudachi reading is missing or the surface itself.
+    plain = KanjiConv(use_custom_readings=False)
+    documents = []
+    for text in texts:
+        documents.append([token.surface for token in plain.tokenize(text) if token.reading == token.surface])
+
+    kanji_conv = KanjiConv(use_custom_readings=False, use_unidic=True, unidic_cache_size=0)
+    tagger = kanji_conv.unidic_tagger
+
+    start = time.perf_counter()
+    per_token_calls = 0
+    for surfaces in documents:
+        for surface in surfaces:
+            list(tagger(surface))
+            per_token_calls += 1
+    per_token = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched_calls = 0
+    for surfaces in documents:
+        if surfaces:
+            kanji_conv._get_unidic_readings(surfaces)
+            batched_calls += 1
+    batched = time.perf_counter() - start
+
+    print(f"{len(texts)} documents, {sum(map(len, documents))} unknown tokens")
+    print(f"{'strategy':>10}  {'tagger calls':>12}  {'seconds':>8}")
+    print(f"{'per token':>10}  {per_token_calls:>12}  {per_token:>8.3f}")
+    print(f"{'batched':>10}  {batched_calls:>12}  {batched:>8.3f}")
+    if batched_calls:
+        print(f"{per_token_calls / batched_calls:.1f}x fewer tagger calls, {per_token / batched:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Column-wise conversion for data frames, Arrow arrays and CSV/Parquet files.
+
+Every distinct value of a column is converted once through ``KanjiConv.convert_many`` and the
+results are scattered back to the rows, which is much faster than ``DataFrame.apply`` on
+columns with repeated values. pandas and pyarrow are optional: they are only imported when a
+pandas or pyarrow object (or a Parquet file) is passed in.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import os
+
+from .kanjiconv import _MODES, KanjiConv
+
+__all__ = ["convert_column", "convert_file"]
+
+_PARQUET_EXTRA_HINT = (
+    'Parquet files require the optional "parquet" extra. Install it with: pip install "kanjiconv[parquet]"'
+)
+
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def _convert_unique(values: list, mode: str, kanji_conv: KanjiConv) -> list:
+    return [result[mode] for result in kanji_conv.convert_many(values, modes=(mode,))]
+
+
+def _is_missing(value) -> bool:
+    return value is None or value != value  # None or NaN
+
+
+def _convert_pandas(values, mode: str, kanji_conv: KanjiConv):
+    import numpy
+    import pandas
+
+    # Missing values get code -1, which picks the None appended after the converted uniques.
+    codes, uniques = pandas.factorize(values)
+    converted = numpy.array([*_convert_unique(list(uniques), mode, kanji_conv), None], dtype=object)
+    # Categorical and other array-likes have no index, and Categorical has no name either.
+    index, name = getattr(values, "index", None), getattr(values, "name", None)
+    return pandas.Series(converted[codes], index=index, name=name, dtype=object)
+
+
+def _convert_arrow(values, mode: str, kanji_conv: KanjiConv):
+    import pyarrow
+
+    if isinstance(values, pyarrow.ChunkedArray):
+        values = values.combine_chunks()
+    # Dictionary encoding deduplicates natively; nulls stay null indices.
+    encoded = values if pyarrow.types.is_dictionary(values.type) else values.dictionary_encode()
+    converted = _convert_unique(encoded.dictionary.to_pylist(), mode, kanji_conv)
+    return pyarrow.array(converted, type=pyarrow.string()).take(encoded.indices)
+
+
+def convert_column(values, mode: str = "roman", kanji_conv: KanjiConv | None = None):
+    """
+    Convert a column of texts, converting each distinct value only once.
+
+    Args:
+        values: A sequence or iterable of strings, a pandas Series, Index or Categorical, or a
+            pyarrow Array or ChunkedArray. Missing values (None, NaN, nulls) stay missing.
+        mode (str): Output format, one of "hiragana", "katakana" and "roman".
+        kanji_conv (KanjiConv | None): Converter to use. Defaults to the shared ``KanjiConv.get()``.
+
+    Returns:
+        A pandas Series for pandas input (with the same index and name as a Series), a pyarrow
+        string Array for pyarrow input, and a list otherwise.
+    """
+    if mode not in _MODES:
+        raise ValueError(f"Invalid mode: {mode!r}. Must be one of {', '.join(_MODES)}.")
+    if kanji_conv is None:
+        kanji_conv = KanjiConv.get()
+
+    # Recognize pandas and pyarrow objects without importing either library.
+    library = type(values).__module__.split(".")[0]
+    if library == "pandas":
+        return _convert_pandas(values, mode, kanji_conv)
+    if library == "pyarrow":
+        return _convert_arrow(values, mode, kanji_conv)
+
+    values = list(values)
+    unique = list(dict.fromkeys(value for value in values if not _is_missing(value)))
+    converted = dict(zip(unique, _convert_unique(unique, mode, kanji_conv)))
+    return [None if _is_missing(value) else converted[value] for value in values]
+
+
+def _with_column(table, name: str, column):
+    if name in table.column_names:
+        return table.set_column(table.column_names.index(name), name, column)
+    return table.append_column(name, column)
+
+
+def _convert_parquet(source, column, output, output_column, mode, kanji_conv, batch_size) -> int:
+    try:
+        import pyarrow
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(_PARQUET_EXTRA_HINT) from e
+
+    parquet_file = pq.ParquetFile(source)
+    if column not in parquet_file.schema_arrow.names:
+        raise ValueError(f"Column {column!r} not found in {os.fspath(source)!r}.")
+
+    rows = 0
+    writer = None
+    try:
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            table = pyarrow.Table.from_batches([batch])
+            table = _with_column(table, output_column, convert_column(table.column(column), mode, kanji_conv))
+            if writer is None:
+                writer = pq.ParquetWriter(output, table.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+        if writer is None:
+            empty = parquet_file.schema_arrow.empty_table()
+            pq.write_table(_with_column(empty, output_column, pyarrow.array([], type=pyarrow.string())), output)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _convert_csv(source, column, output, output_column, mode, kanji_conv, batch_size) -> int:
+    rows = 0
+    with open(source, newline="", encoding="utf-8") as src, open(output, "w", newline="", encoding="utf-8") as dst:
+        reader = csv.DictReader(src)
+        fieldnames = list(reader.fieldnames or ())
+        if column not in fieldnames:
+            raise ValueError(f"Column {column!r} not found in {os.fspath(source)!r}.")
+        if output_column not in fieldnames:
+            fieldnames.append(output_column)
+        writer = csv.DictWriter(dst, fieldnames)
+        writer.writeheader()
+        while batch := list(itertools.islice(reader, batch_size)):
+            converted = convert_column((row[column] for row in batch), mode, kanji_conv)
+            for row, value in zip(batch, converted):
+                row[output_column] = value
+            writer.writerows(batch)
+            rows += len(batch)
+    return rows
+
+
+def convert_file(
+    source: str | os.PathLike,
+    column: str,
+    output: str | os.PathLike,
+    mode: str = "roman",
+    kanji_conv: KanjiConv | None = None,
+    output_column: str | None = None,
+    batch_size: int = 65536,
+) -> int:
+    """
+    Convert one column of a CSV or Parquet file, batch by batch, into a new file.
+
+    Parquet files (``.parquet`` / ``.pq``) are read in record batches and written row group by row
+    group, so memory is bounded by batch_size rather than file size; they need the "parquet"
+    extra. Other files are read as UTF-8 CSV with a header row. The output has the same format and
+    columns as the source, plus the converted column.
+
+    Args:
+        source (str | os.PathLike): Input file.
+        column (str): Name of the column to convert.
+        output (str | os.PathLike): Output file.
+        mode (str): Output format, one of "hiragana", "katakana" and "roman".
+        kanji_conv (KanjiConv | None): Converter to use. Defaults to the shared ``KanjiConv.get()``.
+        output_column (str | None): Name of the converted column; it replaces an existing column
+            of that name. Defaults to ``"<column>_<mode>"``.
+        batch_size (int): Number of rows converted at a time.
+
+    Returns:
+        int: Number of rows converted.
+    """
+    if mode not in _MODES:
+        raise ValueError(f"Invalid mode: {mode!r}. Must be one of {', '.join(_MODES)}.")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size!r}.")
+    if kanji_conv is None:
+        kanji_conv = KanjiConv.get()
+    if output_column is None:
+        output_column = f"{column}_{mode}"
+
+    convert = _convert_parquet if os.fspath(source).lower().endswith(_PARQUET_SUFFIXES) else _convert_csv
+    return convert(source, column, output, output_column, mode, kanji_conv, batch_size)
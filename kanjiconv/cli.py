@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 import argparse
+import socket
 import sys
-from importlib.metadata import PackageNotFoundError, version
+from contextlib import ExitStack
+from typing import Iterable, TextIO
 
 from .kanjiconv import KanjiConv
 
+_IO_BUFFER_SIZE = 1 << 16
+
 
 def get_version() -> str:
+    # importlib.metadata is comparatively slow to import, so only load it when the version is requested.
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("kanjiconv")
     except PackageNotFoundError:
         return "0.0.0"
 
 
+class _VersionAction(argparse.Action):
+    """Like argparse's "version" action, but resolves the version only when the flag is used."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        parser.exit(message=f"{get_version()}\n")
+
+
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="kanjiconv",
@@ -22,8 +39,8 @@ def create_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "text",
-        nargs="+",
-        help="The Japanese sentence to convert.",
+        nargs="*",
+        help="The Japanese sentence to convert. If omitted, lines are read from --input or stdin.",
     )
     parser.add_argument(
         "-m",
@@ -54,18 +71,310 @@ def create_parser() -> argparse.ArgumentParser:
         default="C",
         help="Sudachi split granularity. Default is C (longest units).",
     )
+    parser.add_argument(
+        "-i",
+        "--input",
+        metavar="FILE",
+        help="Convert FILE line by line instead of the text arguments. Use '-' for stdin.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Write converted lines to FILE instead of stdout.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used when converting lines. Output order is preserved. Default is 1.",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Always convert in this process, even if a `kanjiconv serve` daemon is running.",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Socket of the conversion daemon. Defaults to $KANJICONV_SOCKET or a per-user temp path.",
+    )
     parser.add_argument(
         "--version",
-        action="version",
-        version=get_version(),
+        action=_VersionAction,
+        help="Show the installed version and exit.",
+    )
+    return parser
+
+
+def create_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kanjiconv serve",
+        description="Run a conversion daemon that keeps the Sudachi dictionary loaded for fast CLI calls.",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Unix-domain socket to listen on. Defaults to $KANJICONV_SOCKET or a per-user temp path.",
+    )
+    parser.add_argument(
+        "--dict-type",
+        choices=["full", "core", "small"],
+        default="full",
+        help="Sudachi dictionary to preload. Requests still get the dictionary they ask for. Default is full.",
+    )
+    return parser
+
+
+def serve_main(argv: list[str]) -> int:
+    args = create_serve_parser().parse_args(argv)
+    if not hasattr(socket, "AF_UNIX"):
+        print("kanjiconv serve requires Unix-domain socket support.", file=sys.stderr)
+        return 1
+
+    from .server import serve
+
+    try:
+        serve(args.socket, sudachi_dict_type=args.dict_type)
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    return 0
+
+
+def create_compile_readings_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kanjiconv compile-readings",
+        description="Compile a custom readings dictionary (JSON or TSV) into a memory-mappable index.",
+    )
+    parser.add_argument(
+        "source",
+        help="Readings in the kanji_readings.json format, or a .tsv file of surface<TAB>reading lines.",
+    )
+    parser.add_argument("-o", "--output", required=True, metavar="PATH", help="Index file to write.")
+    return parser
+
+
+def compile_readings_main(argv: list[str]) -> int:
+    args = create_compile_readings_parser().parse_args(argv)
+
+    from .readings_index import compile_readings
+
+    try:
+        compile_readings(args.source, args.output)
+    except (OSError, ValueError) as e:
+        print(f"kanjiconv compile-readings: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def create_build_snapshot_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kanjiconv build-snapshot",
+        description=(
+            "Precompute the readings of a corpus into a snapshot that KanjiConv(snapshot=...) looks up before Sudachi."
+        ),
+    )
+    parser.add_argument("corpus", help="UTF-8 text file with one text per line. Blank lines are skipped.")
+    parser.add_argument("-o", "--output", required=True, metavar="PATH", help="Snapshot file to write.")
+    parser.add_argument(
+        "-s",
+        "--separator",
+        default=" ",
+        help="Separator inserted between token readings. Default is a single space.",
+    )
+    parser.add_argument(
+        "--use-unidic",
+        action="store_true",
+        help="Use UniDic as a fallback for readings when available.",
+    )
+    parser.add_argument(
+        "--no-custom-readings",
+        action="store_true",
+        help="Disable custom reading fallback.",
+    )
+    parser.add_argument(
+        "--split-mode",
+        choices=["A", "B", "C"],
+        default="C",
+        help="Sudachi split granularity. Default is C (longest units).",
+    )
+    parser.add_argument(
+        "--dict-type",
+        choices=["full", "core", "small"],
+        default="full",
+        help="Sudachi dictionary to use. Default is full.",
+    )
+    return parser
+
+
+def build_snapshot_main(argv: list[str]) -> int:
+    args = create_build_snapshot_parser().parse_args(argv)
+
+    from .snapshot import build_snapshot
+
+    try:
+        converter = KanjiConv(
+            sudachi_dict_type=args.dict_type,
+            separator=args.separator,
+            use_custom_readings=not args.no_custom_readings,
+            use_unidic=args.use_unidic,
+            sudachi_split_mode=args.split_mode,
+        )
+        with open(args.corpus, encoding="utf-8") as corpus:
+            texts = (line.rstrip("\r\n") for line in corpus)
+            build_snapshot((text for text in texts if text), args.output, converter)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"kanjiconv build-snapshot: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def create_convert_column_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kanjiconv convert-column",
+        description="Convert one column of a CSV or Parquet file batch by batch, converting each distinct value once.",
+    )
+    parser.add_argument(
+        "source", help="Input file: .parquet/.pq (needs the parquet extra) or UTF-8 CSV with a header."
+    )
+    parser.add_argument("-c", "--column", required=True, help="Name of the column to convert.")
+    parser.add_argument("-o", "--output", required=True, metavar="PATH", help="File to write, in the input's format.")
+    parser.add_argument(
+        "--output-column",
+        metavar="NAME",
+        help="Name of the converted column. Default is <column>_<mode>.",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        choices=["roman", "hiragana", "katakana"],
+        default="roman",
+        help="Conversion mode. Default is roman.",
+    )
+    parser.add_argument(
+        "-s",
+        "--separator",
+        default=" ",
+        help="Separator inserted between token readings. Default is a single space.",
+    )
+    parser.add_argument(
+        "--use-unidic",
+        action="store_true",
+        help="Use UniDic as a fallback for readings when available.",
+    )
+    parser.add_argument(
+        "--no-custom-readings",
+        action="store_true",
+        help="Disable custom reading fallback.",
+    )
+    parser.add_argument(
+        "--split-mode",
+        choices=["A", "B", "C"],
+        default="C",
+        help="Sudachi split granularity. Default is C (longest units).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=65536,
+        help="Rows read, converted and written at a time. Default is 65536.",
     )
     return parser
 
 
+def convert_column_main(argv: list[str]) -> int:
+    parser = create_convert_column_parser()
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be a positive integer")
+
+    from .bulk import convert_file
+
+    try:
+        # The result cache carries deduplication across batches.
+        converter = KanjiConv(
+            separator=args.separator,
+            use_custom_readings=not args.no_custom_readings,
+            use_unidic=args.use_unidic,
+            sudachi_split_mode=args.split_mode,
+            cache_size=args.batch_size,
+        )
+        convert_file(
+            args.source,
+            args.column,
+            args.output,
+            mode=args.mode,
+            kanji_conv=converter,
+            output_column=args.output_column,
+            batch_size=args.batch_size,
+        )
+    except (ImportError, OSError, ValueError) as e:
+        print(f"kanjiconv convert-column: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _connect_daemon(args: argparse.Namespace):
+    """Return a daemon-backed converter if a daemon is running, otherwise None."""
+    if args.no_daemon or args.jobs > 1 or not hasattr(socket, "AF_UNIX"):
+        return None
+
+    from .server import DaemonConverter, connect
+
+    client = connect(args.socket)
+    if client is None:
+        return None
+    return DaemonConverter(
+        client,
+        dict_type="full",  # The dictionary an in-process KanjiConv would use.
+        separator=args.separator,
+        split_mode=args.split_mode,
+        use_unidic=args.use_unidic,
+        use_custom_readings=not args.no_custom_readings,
+    )
+
+
+def convert_lines(converter: KanjiConv, mode: str, lines: Iterable[str], output: TextIO, jobs: int = 1) -> None:
+    """Convert each input line with a single converter and write one output line per input line."""
+    texts = (line.rstrip("\r\n") for line in lines)
+    results = converter.convert_many(texts, modes=(mode,), workers=jobs if jobs > 1 else None)
+    for result in results:
+        output.write(result[mode])
+        output.write("\n")
+
+
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["serve"]:
+        return serve_main(argv[1:])
+    if argv[:1] == ["compile-readings"]:
+        return compile_readings_main(argv[1:])
+    if argv[:1] == ["convert-column"]:
+        return convert_column_main(argv[1:])
+    if argv[:1] == ["build-snapshot"]:
+        return build_snapshot_main(argv[1:])
+
     parser = create_parser()
     args = parser.parse_args(argv)
-    text = " ".join(args.text)
+    if args.text and args.input:
+        parser.error("text arguments cannot be combined with --input")
+    if not args.text and not args.input and sys.stdin.isatty():
+        parser.error("no text given; pass text arguments, --input FILE, or pipe lines to stdin")
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+
+    daemon_converter = _connect_daemon(args)
+    if daemon_converter is not None:
+        try:
+            return _run(args, daemon_converter)
+        except (ConnectionError, RuntimeError) as e:
+            print(f"kanjiconv daemon error: {e}", file=sys.stderr)
+            return 1
 
     try:
         converter = KanjiConv(
@@ -77,7 +386,24 @@ def main(argv: list[str] | None = None) -> int:
     except ImportError as e:
         print(str(e), file=sys.stderr)
         return 1
+    return _run(args, converter)
+
+
+def _run(args: argparse.Namespace, converter) -> int:
+    if not args.text:
+        with ExitStack() as stack:
+            if args.input and args.input != "-":
+                lines = stack.enter_context(open(args.input, encoding="utf-8", buffering=_IO_BUFFER_SIZE))
+            else:
+                lines = sys.stdin
+            if args.output:
+                output = stack.enter_context(open(args.output, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE))
+            else:
+                output = sys.stdout
+            convert_lines(converter, args.mode, lines, output, args.jobs)
+        return 0
 
+    text = " ".join(args.text)
     if args.mode == "hiragana":
         result = converter.to_hiragana(text)
     elif args.mode == "katakana":
@@ -85,7 +411,11 @@ def main(argv: list[str] | None = None) -> int:
     else:
         result = converter.to_roman(text)
 
-    print(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            print(result, file=f)
+    else:
+        print(result)
     return 0
 
 
@@ -1 +1,2 @@
 from .sudachi_dict import SudachiDictType
+from .token import Token, TokenSource
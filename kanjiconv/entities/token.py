@@ -0,0 +1,52 @@
+from enum import Enum
+
+
+class TokenSource(Enum):
+    SUDACHI = "sudachi"
+    UNIDIC = "unidic"
+    CUSTOM = "custom"
+    BRACKET = "bracket"
+    PASSTHROUGH = "passthrough"
+
+    def __str__(self):
+        return self.value
+
+
+class Token:
+    """
+    A token of converted text.
+
+    Attributes:
+        surface (str): Surface form as seen by the tokenizer.
+        reading (str): Resolved reading, usually in Katakana.
+        source (TokenSource): Which stage supplied the reading.
+        start (int): Start offset of the token in the original text.
+        end (int): End offset of the token in the original text. Tokens produced from a
+            custom compound reading span the whole compound.
+    """
+
+    __slots__ = ("surface", "reading", "source", "start", "end")
+
+    def __init__(self, surface: str, reading: str, source: TokenSource, start: int, end: int) -> None:
+        self.surface = surface
+        self.reading = reading
+        self.source = source
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return (
+            f"Token(surface={self.surface!r}, reading={self.reading!r}, source={self.source}, "
+            f"start={self.start}, end={self.end})"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Token):
+            return NotImplemented
+        return (self.surface, self.reading, self.source, self.start, self.end) == (
+            other.surface,
+            other.reading,
+            other.source,
+            other.start,
+            other.end,
+        )
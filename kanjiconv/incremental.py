@@ -0,0 +1,170 @@
+"""Incremental reconversion of edited text, for editors and search-as-you-type fields.
+
+The text is kept as a list of sentences, split at the same safe boundaries as
+``KanjiConv.convert_stream``. Each sentence is tokenized after the sentence end that precedes it, as
+in the whole text, so sentences convert independently and an edit only re-tokenizes the sentences it
+touches. The cost of an edit then grows with the size of the edit, not of the text.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+
+from .entities import Token
+from .kanjiconv import _MODES, _NO_BREAK_BEFORE, _SENTENCE_END, KanjiConv, _left_context
+
+__all__ = ["IncrementalConverter"]
+
+
+def _split_sentences(text: str, start: int, end: int) -> list:
+    """Split text[start:end] after sentence ends; the character at end (if any) must not change."""
+    bounds = [start]
+    for match in _SENTENCE_END.finditer(text, start, end):
+        cut = match.end()
+        if bounds[-1] < cut < end and text[cut] not in _NO_BREAK_BEFORE:
+            bounds.append(cut)
+    bounds.append(end)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] < bounds[i + 1]]
+
+
+def _common_prefix(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    low, high = 0, limit
+    # Binary search on slice equality, so long unchanged stretches are compared at C speed.
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class _Sentence:
+    __slots__ = ("text", "context", "tokens", "output")
+
+    def __init__(self, text: str, context: str, tokens: list, output: str) -> None:
+        self.text = text
+        self.context = context  # The sentence end before text, which it was tokenized after.
+        self.tokens = tokens
+        self.output = output
+
+
+class IncrementalConverter:
+    """
+    Keeps a text with its tokens and converted output up to date across edits.
+
+    Args:
+        converter (KanjiConv): Converter whose settings (separator, dictionaries, custom readings)
+            are used.
+        mode (str): Output format, one of "hiragana", "katakana" and "roman".
+        text (str): Initial text.
+
+    Example:
+        >>> incremental = IncrementalConverter(KanjiConv(separator=""), mode="hiragana")
+        >>> incremental.set_text("東京へ行く。")
+        >>> incremental.edit(0, 2, "京都")  # Only the edited sentence is re-tokenized.
+    """
+
+    def __init__(self, converter: KanjiConv, mode: str = "roman", text: str = "") -> None:
+        if mode not in _MODES:
+            raise ValueError(f"Invalid mode: {mode!r}. Must be one of {', '.join(_MODES)}.")
+        self._converter = converter
+        self._convert = getattr(KanjiConv, f"to_{mode}").__wrapped__
+        self.mode = mode
+        self._sentences = []
+        self._starts = []  # Start offset of every sentence, for bisecting.
+        self._output = ""
+        if text:
+            self.edit(0, 0, text)
+
+    @property
+    def text(self) -> str:
+        """The current text."""
+        return "".join(sentence.text for sentence in self._sentences)
+
+    @property
+    def output(self) -> str:
+        """The current text, converted."""
+        if self._output is None:
+            separator = self._convert(self._converter, self._converter.separator)
+            self._output = separator.join(sentence.output for sentence in self._sentences)
+        return self._output
+
+    @property
+    def tokens(self) -> list:
+        """Tokens of the current text, with offsets into ``text``."""
+        tokens = []
+        for start, sentence in zip(self._starts, self._sentences):
+            for token in sentence.tokens:
+                tokens.append(Token(token.surface, token.reading, token.source, token.start + start, token.end + start))
+        return tokens
+
+    def _build_sentence(self, text: str, context: str) -> _Sentence:
+        converter = self._converter
+        tokens = converter._tokenize(text, context)
+        joined = converter.separator.join(token.reading for token in tokens)
+        return _Sentence(text, context, tokens, converter._apply(self._convert, joined))
+
+    def edit(self, start: int, end: int, replacement: str) -> str:
+        """
+        Replace ``text[start:end]`` with replacement and update the output.
+
+        Returns:
+            str: The new output.
+        """
+        length = self._starts[-1] + len(self._sentences[-1].text) if self._sentences else 0
+        if not 0 <= start <= end <= length:
+            raise ValueError(f"Edit range {start}:{end} is outside the text of length {length}.")
+
+        # Sentences touching the edited range, including neighbours that merely touch it: an edit at a
+        # boundary can merge them or move the boundary.
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        last = max(bisect_right(self._starts, end) - 1, 0)
+        if self._sentences and start == self._starts[first] and first > 0:
+            first -= 1
+        last_end = self._starts[last] + len(self._sentences[last].text) if self._sentences else 0
+        if last + 1 < len(self._sentences) and end == last_end:
+            last += 1
+
+        if self._sentences:
+            window_start = self._starts[first]
+            old = "".join(sentence.text for sentence in self._sentences[first : last + 1])
+        else:
+            window_start, old = 0, ""
+        window = old[: start - window_start] + replacement + old[end - window_start :]
+
+        # Split the new window; the character after it (the next sentence's first) is unchanged.
+        following = self._sentences[last + 1].text[:1] if last + 1 < len(self._sentences) else ""
+        spans = _split_sentences(window + following, 0, len(window))
+        context = _left_context(self._sentences[first - 1].text) if first > 0 else ""
+        rebuilt = []
+        for s, e in spans:
+            rebuilt.append(self._build_sentence(window[s:e], context))
+            context = _left_context(rebuilt[-1].text)
+        # The edit can change the sentence end the next sentence was tokenized after.
+        while last + 1 < len(self._sentences) and self._sentences[last + 1].context != context:
+            last += 1
+            rebuilt.append(self._build_sentence(self._sentences[last].text, context))
+            context = _left_context(rebuilt[-1].text)
+
+        self._sentences[first : last + 1] = rebuilt
+        position = self._starts[first] if first < len(self._starts) else 0
+        del self._starts[first:]
+        for sentence in self._sentences[first:]:
+            self._starts.append(position)
+            position += len(sentence.text)
+        self._output = None
+        return self.output
+
+    def set_text(self, text: str) -> str:
+        """
+        Replace the whole text, re-converting only the part that differs from the current text.
+
+        Returns:
+            str: The new output.
+        """
+        current = self.text
+        prefix = _common_prefix(current, text)
+        suffix = _common_prefix(current[prefix:][::-1], text[prefix:][::-1])
+        return self.edit(prefix, len(current) - suffix, text[prefix : len(text) - suffix])
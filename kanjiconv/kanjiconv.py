@@ -1,21 +1,39 @@
-import importlib
-import importlib.resources
-import json
+from __future__ import annotations
+
+import importlib.util
+import itertools
 import logging
-from functools import lru_cache
-from typing import Callable
+import os
+import re
+import sys
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Mapping, MutableMapping
+from functools import lru_cache, wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
-import sudachipy
+from kanjiconv.entities import SudachiDictType, Token, TokenSource
 
-try:
-    import fugashi
-    import unidic
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+
+# Heavy dependencies (sudachipy, fugashi/unidic, asyncio, multiprocessing) are imported on first
+# use, so importing kanjiconv and running `kanjiconv --help` / `--version` stays fast.
+
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ValueError:
+        # Already imported without a spec (e.g. created at runtime), so it is importable.
+        return name in sys.modules
 
-    UNIDIC_AVAILABLE = True
-except ImportError:
-    UNIDIC_AVAILABLE = False
 
-from kanjiconv.entities import SudachiDictType
+UNIDIC_AVAILABLE = _module_available("fugashi") and _module_available("unidic")
 
 __all__ = ["KanjiConv"]
 
@@ -26,34 +44,751 @@ _UNIDIC_EXTRA_HINT = (
     'pip install "kanjiconv[unidic]", then run: python -m unidic download'
 )
 
-_SPLIT_MODES = {
-    "A": sudachipy.SplitMode.A,
-    "B": sudachipy.SplitMode.B,
-    "C": sudachipy.SplitMode.C,
-}
+_MODES = ("hiragana", "katakana", "roman")
+
+_SPLIT_MODES = ("A", "B", "C")
+
+
+@lru_cache(maxsize=None)
+def _get_split_mode(name: str):
+    import sudachipy
+
+    return getattr(sudachipy.SplitMode, name)
 
 
 @lru_cache(maxsize=None)
 def _load_kana() -> dict:
+    import importlib.resources
+    import json
+
     kana_path = importlib.resources.files("kanjiconv.data").joinpath("kana.json")
     with kana_path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+class _RomajiTable(dict):
+    """Katakana unit -> romaji table that derives and remembers entries it was not precompiled with."""
+
+    __slots__ = ("_compose",)
+
+    # Units with longer runs of long vowel marks (スゴーーーーイ) are composed on every lookup
+    # instead of remembered, so arbitrary input cannot grow this process-wide table without bound.
+    _MAX_STORED_LONG_VOWELS = 3
+
+    def __init__(self, compose: Callable) -> None:
+        super().__init__()
+        self._compose = compose
+
+    def __missing__(self, key: str) -> str:
+        romaji = self._compose(key)
+        # Only kana units are remembered; runs of other text are passed through as-is.
+        if romaji is not key and len(key) - len(key.rstrip("ー")) <= self._MAX_STORED_LONG_VOWELS:
+            self[key] = romaji
+        return romaji
+
+
+class _RomajiTransducer:
+    """
+    Longest-match katakana to romaji transducer compiled once from kana.json.
+
+    The input is split by a single regex into runs of non-kana text and kana units (an
+    optional sokuon, a digraph or single character, then any long vowel marks). Each unit
+    is mapped through a precomputed table and the pieces are joined once, so conversion is
+    linear in the length of the text.
+    """
+
+    # Characters handled as kana; other characters are copied to the output unchanged.
+    _KANA_RANGE = "\u3001-\u30fc"
+    _SOKUON = "ッ"
+    _LONG_VOWEL = "ー"
+    _VOWELS = "aeiou"
+    _GEMINABLE = "bcdfghjklmpqrstvwxyz"
+
+    def __init__(self, kana: dict) -> None:
+        self._units = kana["katakana2roman"]
+        digraphs = sorted((unit for unit in self._units if len(unit) > 1), key=len, reverse=True)
+        self._pattern = re.compile(
+            f"[^{self._KANA_RANGE}]+"
+            f"|{self._SOKUON}?(?:{'|'.join(map(re.escape, digraphs))}|[{self._KANA_RANGE}]){self._LONG_VOWEL}*"
+        )
+        self._table = _RomajiTable(self._compose)
+        for unit in self._units:
+            for prefix in ("", self._SOKUON):
+                for suffix in ("", self._LONG_VOWEL):
+                    key = prefix + unit + suffix
+                    self._table[key] = self._compose(key)
+
+    def _compose(self, text: str) -> str:
+        if not ("\u3001" <= text[0] <= "\u30fc"):
+            return text
+        sokuon = len(text) > 1 and text[0] == self._SOKUON
+        body = text[1:] if sokuon else text
+        unit = body.rstrip(self._LONG_VOWEL) or body[0]
+        romaji = self._units.get(unit, "")
+        if sokuon and romaji and romaji[0] in self._GEMINABLE:
+            # Double the consonant (ッカ -> kka); "ch" is doubled as "tch" as in Hepburn.
+            romaji = ("t" if romaji.startswith("ch") else romaji[0]) + romaji
+        if romaji and romaji[-1] in self._VOWELS:
+            romaji += romaji[-1] * (len(body) - len(unit))
+        return romaji
+
+    def __call__(self, text: str) -> str:
+        return "".join(map(self._table.__getitem__, self._pattern.findall(text)))
+
+
+@lru_cache(maxsize=None)
+def _get_romaji_transducer() -> _RomajiTransducer:
+    return _RomajiTransducer(_load_kana())
+
+
+# Hiragana -> katakana, as Sudachi reads kana written phrases.
+_KATAKANA_TABLE = {code: code + 0x60 for code in range(ord("ぁ"), ord("ゖ") + 1)}
+
+# Kana-only phrases delimited by punctuation, whitespace or the text edges. Sudachi reads such a
+# phrase as written and never joins it with its neighbours, so it can skip the tokenizer. Only kana
+# that Sudachi reads as themselves qualify: it normalizes ゐゑヰヱ (to イエ), ゕゖヵヶ (to カケ),
+# ゔ/ヴ and runs of ー (to a single ー), and reads the small vowels ぁぃぅぇぉ and ゎ as long vowels
+# or drops them (ねェ -> ネー, だよなァ -> ダヨナ), so phrases containing them still go through Sudachi.
+_KANA_PHRASE_DELIMITERS = r"\s、。，．！？!?「」『』（）()・"
+_FAST_KANA = "あいうえおか-ろわをんアイウエオカ-ロワヲン"
+_KANA_PHRASE = re.compile(
+    rf"(?<![^{_KANA_PHRASE_DELIMITERS}])(?:[{_FAST_KANA}]|ー(?!ー))+(?![^{_KANA_PHRASE_DELIMITERS}])"
+)
+
+# Katakana -> hiragana, including ヴ/ヵ/ヶ and the iteration marks ヽ/ヾ, for a single str.translate call.
+_HIRAGANA_TABLE = {code: code - 0x60 for code in (*range(ord("ァ"), ord("ヶ") + 1), ord("ヽ"), ord("ヾ"))}
+
+
 @lru_cache(maxsize=None)
 def _load_custom_readings() -> tuple:
+    import importlib.resources
+    import json
+
     try:
         readings_path = importlib.resources.files("kanjiconv.data").joinpath("kanji_readings.json")
         with readings_path.open("r", encoding="utf-8") as f:
             data = json.load(f)
     except (FileNotFoundError, KeyError):
-        data = {"single": {}, "compound": {}}
-    return (data.get("single", {}), data.get("compound", {}))
+        data = {"single": {}, "compound": {}, "context": {}}
+    return tuple(_BundledTable(name, data.get(name, {})) for name in _BUNDLED_TABLES)
+
+
+_BUNDLED_TABLES = ("single", "compound", "context")
+
+
+def _bundled_table(name: str) -> _BundledTable:
+    return _load_custom_readings()[_BUNDLED_TABLES.index(name)]
+
+
+class _BundledTable(Mapping):
+    """Read-only bundled readings table, shared by every instance and pickled by name."""
+
+    __slots__ = ("_name", "_data")
+
+    __hash__ = object.__hash__
+
+    def __init__(self, name: str, data: dict) -> None:
+        self._name = name
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __reduce__(self):
+        return _bundled_table, (self._name,)
+
+
+def _select_reading(candidates, rules: Mapping, previous: str, following: str, part_of_speech: str) -> str:
+    """
+    Pick a single-kanji reading from its candidates using the "context" rules of that kanji.
+
+    Each rule kind maps a feature of the neighbouring tokens to the reading it votes for: "prev"
+    the last character of the previous token, "next" the first character of the next token and
+    "pos" the kanji's own part of speech. The reading with most votes wins, ties going to the
+    earlier candidate; without any vote the first candidate is used.
+    """
+    votes = {}
+    for kind, feature in (("prev", previous[-1:]), ("next", following[:1]), ("pos", part_of_speech)):
+        reading = rules.get(kind, {}).get(feature)
+        if reading:
+            votes[reading] = votes.get(reading, 0) + 1
+    if not votes:
+        return candidates[0]
+    best = max(votes.values())
+    for candidate in candidates:
+        if votes.get(candidate) == best:
+            return candidate
+    return next(reading for reading, count in votes.items() if count == best)
+
+
+# Globally unique, monotonically increasing versions: a freshly built dict never shares
+# a version with the one it replaces, so (single, compound) versions identify contents.
+_READINGS_VERSIONS = itertools.count()
+
+
+class _VersionedDict(dict):
+    """dict that records a new version on every mutation, so derived indexes can rebuild lazily."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.version = next(_READINGS_VERSIONS)
+        self.update(*args, **kwargs)
+
+    def _touch(self) -> None:
+        self.version = next(_READINGS_VERSIONS)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+        self._touch()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        result = super().pop(key, *default)
+        self._touch()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._touch()
+        return result
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+
+class _ReadingsOverlay(MutableMapping):
+    """
+    Copy-on-write view of a readings table.
+
+    Lookups fall through to a read-only base table (the bundled readings or a memory-mapped
+    index) that is shared between instances; writes and deletions are kept in this overlay, so
+    an instance can customize its readings without copying the base. Besides the mapping
+    methods it supports ``copy()`` and ``|`` like a dict; both return plain dicts.
+    """
+
+    __slots__ = ("base", "_overrides", "_deleted", "version")
+
+    def __init__(self, base: Mapping, overrides: dict | None = None, deleted: Iterable = ()) -> None:
+        self.base = base
+        self._overrides = dict(overrides or {})
+        self._deleted = set(deleted)
+        self.version = next(_READINGS_VERSIONS)
+
+    @property
+    def modified(self) -> bool:
+        """Whether the overlay differs from its base table."""
+        return bool(self._overrides or self._deleted)
+
+    def _touch(self) -> None:
+        self.version = next(_READINGS_VERSIONS)
+
+    def __getitem__(self, key):
+        if key in self._overrides:
+            return self._overrides[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        return self.base[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._overrides or (key not in self._deleted and key in self.base)
+
+    def __setitem__(self, key, value) -> None:
+        self._overrides[key] = value
+        self._deleted.discard(key)
+        self._touch()
+
+    def __delitem__(self, key) -> None:
+        found = self._overrides.pop(key, _MISSING) is not _MISSING
+        if key not in self._deleted and key in self.base:
+            self._deleted.add(key)
+            found = True
+        if not found:
+            raise KeyError(key)
+        self._touch()
+
+    def __iter__(self):
+        yield from self._overrides
+        for key in self.base:
+            if key not in self._overrides and key not in self._deleted:
+                yield key
+
+    def __len__(self) -> int:
+        # Deleted keys are always base keys that are not overridden.
+        added = sum(1 for key in self._overrides if key not in self.base)
+        return len(self.base) - len(self._deleted) + added
+
+    def clear(self) -> None:
+        self._overrides.clear()
+        self._deleted = set(self.base)
+        self._touch()
+
+    def to_dict(self) -> dict:
+        """The table as a plain dict, e.g. for ``json.dump``."""
+        return {key: self[key] for key in self}
+
+    copy = to_dict
+
+    def __or__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return self.to_dict() | dict(other)
+
+    def __ror__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(other) | self.to_dict()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def _clone(self) -> _ReadingsOverlay:
+        return _ReadingsOverlay(self.base, self._overrides, self._deleted)
+
+    def __reduce__(self):
+        return _ReadingsOverlay, (self.base, self._overrides, self._deleted)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class _CustomReadings(_VersionedDict):
+    """
+    Top-level custom readings mapping; nested tables are wrapped so their mutations are tracked too.
+
+    Assigned dicts are copied. Read-only mappings (the bundled tables, a compiled readings index)
+    are shared as the base of a copy-on-write overlay instead.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        """The readings as plain nested dicts, e.g. for ``json.dump``."""
+        return {name: table.to_dict() for name, table in self.items()}
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(value, _ReadingsOverlay):
+            value = value._clone()
+        elif isinstance(value, (dict, MutableMapping)):
+            value = _ReadingsOverlay({}, value)
+        else:
+            value = _ReadingsOverlay(value)
+        super().__setitem__(key, value)
+
+
+@lru_cache(maxsize=8)
+def _get_shared_compound_matcher(compounds: Mapping) -> _CompoundMatcher:
+    # Matchers over unmodified shared tables are built once per process, not once per instance.
+    if hasattr(compounds, "prefix_matches"):
+        return _IndexCompoundMatcher(compounds)
+    return _CompoundMatcher(compounds)
+
+
+class _CompoundMatcher:
+    """
+    Trie over compound surfaces that replaces all matches in one left-to-right pass.
+
+    At every position the longest matching compound wins, and scanning resumes after it.
+    Candidate start positions are found with a character-class regex, so text without any
+    compound's first character is skipped at C speed.
+    """
+
+    __slots__ = ("_root", "_starts")
+
+    _END = ""  # Trie children are keyed by single characters, so "" can mark a terminal node.
+
+    def __init__(self, compounds: dict) -> None:
+        self._root = {}
+        for surface, reading in compounds.items():
+            if not surface:
+                continue
+            node = self._root
+            for char in surface:
+                node = node.setdefault(char, {})
+            node[self._END] = reading
+        self._starts = self._start_pattern(self._root)
+
+    @staticmethod
+    def _start_pattern(first_characters: Iterable[str]) -> re.Pattern | None:
+        first_characters = "".join(map(re.escape, first_characters))
+        return re.compile(f"[{first_characters}]") if first_characters else None
+
+    def _longest(self, text: str, start: int) -> tuple:
+        """``(end, reading)`` of the longest compound at start, or ``(-1, None)``."""
+        end_marker = self._END
+        node = self._root
+        i = start
+        found_end = -1
+        reading = None
+        while i < len(text):
+            node = node.get(text[i])
+            if node is None:
+                break
+            i += 1
+            if end_marker in node:
+                found_end = i
+                reading = node[end_marker]
+        return found_end, reading
+
+    def finditer(self, text: str) -> Iterator[tuple]:
+        """
+        Yield non-overlapping leftmost-longest matches as ``(start, end, reading)`` tuples.
+        """
+        if self._starts is None:
+            return
+        search = self._starts.search
+        match = search(text)
+        while match:
+            start = match.start()
+            found_end, reading = self._longest(text, start)
+            if found_end < 0:
+                match = search(text, start + 1)
+                continue
+            yield start, found_end, reading
+            match = search(text, found_end)
+
+    def rewrite(self, text: str) -> tuple:
+        """
+        Replace every compound in text with its reading.
+
+        Returns:
+            tuple: The rewritten text and an offset map back to the original text.
+        """
+        pieces = []
+        spans = []
+        pos = 0
+        new_pos = 0
+        for start, end, reading in self.finditer(text):
+            pieces.append(text[pos:start])
+            pieces.append(reading)
+            new_pos += start - pos
+            spans.append((new_pos, new_pos + len(reading), start, end))
+            new_pos += len(reading)
+            pos = end
+        if not pieces:
+            return text, None
+        pieces.append(text[pos:])
+        return "".join(pieces), _OffsetMap(spans)
+
+
+class _IndexCompoundMatcher(_CompoundMatcher):
+    """
+    Compound matcher over a memory-mapped readings index, searched in place.
+
+    Matches are found by prefix binary search on the index's sorted table, so no process copies
+    the index into a trie. Only an instance's own overrides go into a (small) trie, and compounds it
+    deleted are skipped.
+    """
+
+    __slots__ = ("_table", "_overrides", "_deleted")
+
+    def __init__(self, table: Mapping, overrides: dict | None = None, deleted: Iterable = ()) -> None:
+        self._overrides = dict(overrides or {})
+        super().__init__(self._overrides)
+        self._table = table
+        self._deleted = frozenset(deleted)
+        self._starts = self._start_pattern(set(table.first_characters()).union(self._root))
+
+    def _longest(self, text: str, start: int) -> tuple:
+        found_end, reading = super()._longest(text, start)
+        for end, table_reading in self._table.prefix_matches(text, start):
+            if end > found_end:
+                surface = text[start:end]
+                if surface not in self._overrides and surface not in self._deleted:
+                    found_end, reading = end, table_reading
+        return found_end, reading
+
+
+class _OffsetMap:
+    """Maps offsets in compound-rewritten text back to the original text."""
+
+    __slots__ = ("_spans", "_new_ends")
+
+    def __init__(self, spans: list) -> None:
+        # (new_start, new_end, orig_start, orig_end) for each replaced compound, in order.
+        self._spans = spans
+        self._new_ends = [span[1] for span in spans]
+
+    def map(self, start: int, end: int) -> tuple:
+        """
+        Map a ``[start, end)`` range of the rewritten text to the original text.
+
+        Returns:
+            tuple: ``(orig_start, orig_end, in_compound)``; ranges touching a replaced compound
+            are widened to the whole compound.
+        """
+        spans = self._spans
+        count = len(spans)
+
+        i = bisect_right(self._new_ends, start)
+        if i < count and spans[i][0] <= start:
+            orig_start = spans[i][2]
+        else:
+            orig_start = start + (spans[i - 1][3] - spans[i - 1][1] if i else 0)
+
+        j = bisect_left(self._new_ends, end)
+        if j < count and spans[j][0] < end:
+            orig_end = spans[j][3]
+        else:
+            orig_end = end + (spans[j - 1][3] - spans[j - 1][1] if j else 0)
+
+        return orig_start, orig_end, i < count and spans[i][0] < end
+
+
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class _LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used entry and counts hits and misses."""
+
+    __slots__ = ("maxsize", "hits", "misses", "_data", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> _CacheInfo:
+        with self._lock:
+            return _CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the cached keys and values."""
+        with self._lock:
+            return sum(_approx_nbytes(key) + _approx_nbytes(value) for key, value in self._data.items())
+
+
+def _approx_nbytes(value) -> int:
+    # The container plus the strings it holds; shared objects such as functions are not counted.
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value if isinstance(item, str))
+    return sys.getsizeof(value)
+
+
+def _cache_stats(info: _CacheInfo) -> dict:
+    lookups = info.hits + info.misses
+    return {**info._asdict(), "hit_rate": info.hits / lookups if lookups else 0.0}
+
+
+class _Instrumentation:
+    """
+    Cumulative per-stage timings and token counts of one KanjiConv instance.
+
+    Stages are "compound" (compound replacement), "tokenize" (Sudachi), "unidic" and "custom"
+    (reading fallbacks) and the output passes "hiragana", "katakana" and "roman".
+    """
+
+    __slots__ = ("_callback", "_lock", "_seconds", "_calls", "_tokens", "_sources")
+
+    def __init__(self, callback: Callable[[dict], None] | None = None) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._seconds = {}
+            self._calls = {}
+            self._tokens = 0
+            self._sources = {}
+
+    def record(self, stages: dict, tokens: list = ()) -> None:
+        """Add one tokenization or output pass: seconds per stage, and the tokens it produced."""
+        sources = {}
+        for token in tokens:
+            sources[token.source.value] = sources.get(token.source.value, 0) + 1
+        with self._lock:
+            for stage, seconds in stages.items():
+                self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+                self._calls[stage] = self._calls.get(stage, 0) + 1
+            self._tokens += len(tokens)
+            for source, count in sources.items():
+                self._sources[source] = self._sources.get(source, 0) + count
+        if self._callback is not None:
+            self._callback({"stages": stages, "tokens": len(tokens), "sources": sources})
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "stages": {
+                    stage: {"calls": self._calls[stage], "seconds": seconds} for stage, seconds in self._seconds.items()
+                },
+                "tokens": self._tokens,
+                "sources": dict(self._sources),
+            }
+
+
+class _PerThread:
+    """
+    Objects created lazily once per thread and argument tuple.
+
+    Sudachi tokenizers and MeCab taggers keep mutable state between calls and are not documented
+    as thread-safe, so every thread gets its own; the dictionaries behind them are shared.
+    """
+
+    def __init__(self, factory: Callable) -> None:
+        self._factory = factory
+        self._local = threading.local()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def get(self, *args):
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.objects = {}
+            local.generation = self._generation
+        obj = local.objects.get(args, _MISSING)
+        if obj is _MISSING:
+            obj = local.objects[args] = self._factory(*args)
+            with self._lock:
+                self.created += 1
+        return obj
+
+    def clear(self) -> None:
+        """Drop the objects of every thread; each thread notices on its next get()."""
+        self._generation += 1
+        self.created = 0
+
+
+def _create_unidic_tagger():
+    import fugashi
+    import unidic
+
+    return fugashi.Tagger(unidic.DICDIR)
+
+
+_unidic_taggers = _PerThread(_create_unidic_tagger)
+
+
+def _get_unidic_tagger():
+    return _unidic_taggers.get()
+
+
+@lru_cache(maxsize=None)
+def _get_shared_unidic_memo(maxsize: int) -> _LRUCache:
+    # UniDic readings depend only on the surface and the installed dictionary, so a memo can be shared freely.
+    return _LRUCache(maxsize)
 
 
 @lru_cache(maxsize=None)
-def _get_tokenizer(dict_type: str):
-    return sudachipy.Dictionary(dict=dict_type).create()
+def _get_dictionary(dict_type: str, user_dicts: tuple = ()):
+    # The loaded dictionary is read-only and shared by every thread's tokenizer.
+    import sudachipy
+
+    if user_dicts:
+        from sudachipy.config import Config  # Only re-exported as sudachipy.Config since 0.6.9.
+
+        return sudachipy.Dictionary(dict=dict_type, config=Config(user=list(user_dicts)))
+    return sudachipy.Dictionary(dict=dict_type)
+
+
+_tokenizers = _PerThread(lambda dict_type, user_dicts: _get_dictionary(dict_type, user_dicts).create())
+
+
+def _get_tokenizer(dict_type: str, user_dicts: tuple = ()):
+    """Sudachi tokenizer of the calling thread."""
+    return _tokenizers.get(dict_type, user_dicts)
+
+
+# Sentence ends (with trailing closing brackets/quotes and whitespace) and weaker break points,
+# used to split long documents where tokenization cannot differ from the whole document's.
+_SENTENCE_END = re.compile(r"[。．！？!?\n]+[」』）)\]】〕〉》”’\"']*\s*")
+_SOFT_BREAK = re.compile(r"[、，,\s]+")
+# Characters that modify the preceding kana, so a chunk must never start with them.
+_NO_BREAK_BEFORE = frozenset("ーゝゞヽヾ")
+# The sentence end or soft break a chunk ends with. It is tokenized again in front of the next chunk,
+# so Sudachi segments that chunk after the same break as in the whole text, not at a start of text.
+_TRAILING_BREAK = re.compile(rf"(?:{_SENTENCE_END.pattern}|{_SOFT_BREAK.pattern})$")
+
+
+def _left_context(previous: str) -> str:
+    """Break at the end of previous (the text before a chunk), or "" if it ends elsewhere."""
+    match = _TRAILING_BREAK.search(previous, max(len(previous) - 32, 0))
+    return match.group() if match else ""
+
+
+def _find_break(text: str, start: int, limit: int) -> int:
+    """Last safe split position in text[start:limit]; text must extend past limit."""
+    for pattern in (_SENTENCE_END, _SOFT_BREAK):
+        cut = -1
+        for match in pattern.finditer(text, start, limit):
+            if match.end() > start and text[match.end()] not in _NO_BREAK_BEFORE:
+                cut = match.end()
+        if cut > 0:
+            return cut
+    return limit  # No break point at all: split hard at the chunk size.
+
+
+def _document_chunks(pieces: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Regroup text pieces into chunks of at most about chunk_size characters, split at break points."""
+    buffer = ""
+    for piece in pieces:
+        buffer = buffer + piece if buffer else piece
+        start = 0
+        while len(buffer) - start > chunk_size:
+            cut = _find_break(buffer, start, start + chunk_size)
+            yield buffer[start:cut]
+            start = cut
+        buffer = buffer[start:]
+    if buffer:
+        yield buffer
 
 
 def parse_text(func: Callable) -> Callable:
@@ -63,56 +798,28 @@ def parse_text(func: Callable) -> Callable:
     Args:
         func (Callable): The function to be wrapped, which takes the readings as input.
 
+    The wrapped function accepts a keyword-only ``as_list`` flag. When true, each token's reading is
+    converted separately and the list is returned, skipping the join with the separator (and the
+    result cache).
+
     Returns:
         Callable: Wrapped function that processes the readings.
     """
 
-    def wrapper(self, text: str):
-        # Try custom compound conversion
-        if self.use_custom_readings:
-            for compound, reading in self.custom_readings.get("compound", {}).items():
-                text = text.replace(compound, reading)
-
-        # Tokenize using Sudachi and get readings
-        tokens = self.tokenizer.tokenize(text, self._sudachi_split_mode)
-        readings = []
-
-        # Process each token
-        for token in tokens:
-            surface = token.surface()
-
-            if surface.startswith("[") and surface.endswith("]"):
-                # Process custom readings in brackets
-                readings.append(surface[1:-1])  # Remove brackets
-                continue
-
-            reading = token.reading_form()
-            has_no_reading = not reading or reading == surface
-
-            # If reading is not available, use UniDic
-            if has_no_reading and self.use_unidic and self.unidic_tagger:
-                try:
-                    # Run morphological analysis with UniDic
-                    unidic_nodes = self.unidic_tagger(surface)
-                    unidic_readings = [
-                        node.feature.kana for node in unidic_nodes if getattr(node.feature, "kana", None)
-                    ]
-                    if unidic_readings:
-                        reading = "".join(unidic_readings)
-                        has_no_reading = False
-                except Exception:
-                    # Ignore errors with UniDic and continue
-                    logger.debug("UniDic lookup failed for %r", surface, exc_info=True)
-
-            # If still no reading is available, use custom dictionary
-            if has_no_reading and self.use_custom_readings and surface in self.custom_readings.get("single", {}):
-                reading = self.custom_readings["single"][surface][0]
-
-            readings.append(reading if reading else surface)
-
-        # Join with separator
-        joined_readings = self.separator.join(readings)
-        return func(self, joined_readings)
+    @wraps(func)
+    def wrapper(self, text: str, *, as_list: bool = False):
+        instrumentation = self._instrumentation
+        if as_list:
+            readings = self._get_readings(text)
+            if instrumentation is None:
+                return [func(self, reading) for reading in readings]
+            start = perf_counter()
+            results = [func(self, reading) for reading in readings]
+            instrumentation.record({func.__name__[3:]: perf_counter() - start})
+            return results
+        if self._result_cache is None and instrumentation is None:
+            return func(self, self._joined_readings(text))
+        return self._convert(text, ((func, func),))[func]
 
     return wrapper
 
@@ -121,6 +828,9 @@ class KanjiConv:
     """
     Class for converting Japanese text between different formats such as Hiragana, Katakana, and Roman characters.
 
+    Instances are safe to use from several threads at once: every thread gets its own Sudachi
+    tokenizer and UniDic tagger, sharing the loaded dictionaries.
+
     This class uses multiple dictionaries to convert kanji readings:
     1. SudachiPy: Used as the main dictionary
     2. UniDic: Used as a fallback when SudachiPy cannot resolve readings (optional)
@@ -134,6 +844,17 @@ class KanjiConv:
         use_custom_readings: bool = True,
         use_unidic: bool = False,
         sudachi_split_mode: str = "C",
+        cache_size: int = 0,
+        unidic_cache_size: int = 4096,
+        share_unidic_cache: bool = False,
+        executor: Executor | None = None,
+        max_in_flight: int = 64,
+        readings_index: str | os.PathLike | None = None,
+        user_dict: str | os.PathLike | list | None = None,
+        instrument: bool = False,
+        stats_callback: Callable[[dict], None] | None = None,
+        kana_fast_path: bool = True,
+        snapshot: str | os.PathLike | None = None,
     ) -> None:
         """
         Initializes the KanjiConv instance with a tokenizer and kana conversion data.
@@ -145,41 +866,807 @@ class KanjiConv:
             use_unidic (bool): Whether to use UniDic for additional readings. Requires the
                 optional "unidic" extra (``pip install "kanjiconv[unidic]"``).
             sudachi_split_mode (str): Sudachi split granularity, one of "A", "B", "C" (default "C").
+            cache_size (int): Maximum number of conversion results to keep in an LRU cache.
+                0 (the default) disables the cache.
+            unidic_cache_size (int): Maximum number of surface to UniDic reading lookups to memoize.
+                0 disables the memo.
+            share_unidic_cache (bool): Share the UniDic memo with every other instance that sets this
+                flag and uses the same unidic_cache_size, instead of keeping a per-instance memo.
+            executor (Executor | None): Executor that runs conversions for the async ``ato_*`` methods.
+                A ProcessPoolExecutor converts in worker processes. Defaults to a pool of up
+                to four threads owned by this instance.
+            max_in_flight (int): Maximum number of async conversions submitted to the executor at
+                once; further callers wait, which applies backpressure.
+            readings_index (str | os.PathLike | None): Path of a readings index built with
+                ``kanjiconv compile-readings``, used instead of the bundled custom readings. The file
+                is memory-mapped and shared by every instance and worker process that opens it.
+            user_dict (str | os.PathLike | list | None): Path, or list of paths, of ``surface,reading``
+                CSV files compiled into a Sudachi user dictionary, so Sudachi segments and reads those
+                words itself. The compiled dictionary is cached and only rebuilt when a file changes.
+            instrument (bool): Record per-stage timings, token counts and reading-source counts,
+                reported by ``stats()``. Off by default, when it costs a single check per conversion.
+            stats_callback (Callable[[dict], None] | None): Called after every tokenization and every
+                output pass with that step's ``{"stages", "tokens", "sources"}``, e.g. to export to a
+                metrics system. Implies ``instrument=True``. It runs on the converting thread.
+            kana_fast_path (bool): With an empty separator, convert kana-only phrases (delimited by
+                punctuation or whitespace) directly instead of through Sudachi. The output is the same;
+                ``stats()["fast_path"]`` reports the share of input served this way.
+            snapshot (str | os.PathLike | None): Path of a snapshot built with ``build_snapshot``.
+                Texts it contains are answered from it without Sudachi. Raises ValueError if it was
+                built with different settings; if the settings change later, it is no longer consulted.
         """
         self.kana = _load_kana()
+        self._romaji = _get_romaji_transducer()
+
+        # Custom readings are shared read-only tables; per-instance changes go to an overlay.
+        if readings_index is not None:
+            from .readings_index import load_readings_index
 
-        # Load custom kanji readings (copy so per-instance mutation doesn't leak via the cache).
-        single, compound = _load_custom_readings()
-        self.custom_readings = {"single": dict(single), "compound": dict(compound)}
+            index = load_readings_index(readings_index)
+            self.custom_readings = {"single": index.single, "compound": index.compound}
+        else:
+            single, compound, context = _load_custom_readings()
+            self.custom_readings = {"single": single, "compound": compound, "context": context}
+        self._compound_matcher = None  # (version of the compound table, matcher), replaced atomically.
 
         # Sudachi tokenizer is created lazily and shared across instances with the same dict type.
         self._sudachi_dict_type = sudachi_dict_type
-        try:
-            self._sudachi_split_mode = _SPLIT_MODES[sudachi_split_mode]
-        except KeyError:
-            raise ValueError(
-                f"Invalid sudachi_split_mode: {sudachi_split_mode!r}. Must be one of 'A', 'B', 'C'."
-            ) from None
+        self._sudachi_split_mode_name = sudachi_split_mode
+        if isinstance(user_dict, (str, os.PathLike)):
+            user_dict = [user_dict]
+        self._user_dict_sources = tuple(os.path.abspath(os.fspath(path)) for path in user_dict or ())
+        self._user_dict_paths = None
+        if sudachi_split_mode not in _SPLIT_MODES:
+            raise ValueError(f"Invalid sudachi_split_mode: {sudachi_split_mode!r}. Must be one of 'A', 'B', 'C'.")
 
         self.separator = separator
         self.use_custom_readings = use_custom_readings
 
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be a non-negative integer, got {cache_size!r}.")
+        self._result_cache = _LRUCache(cache_size) if cache_size else None
+        self._instrumentation = _Instrumentation(stats_callback) if instrument or stats_callback else None
+        self.kana_fast_path = kana_fast_path
+        self._fast_path_blocked = None  # (version of the single table, characters it gives readings to)
+        self._fast_path_counts = [0, 0]  # Characters converted by the fast path, characters converted.
+        self._fast_path_lock = threading.Lock()
+
         # Initialize UniDic if enabled
         if use_unidic and not UNIDIC_AVAILABLE:
             raise ImportError(_UNIDIC_EXTRA_HINT)
         self.use_unidic = use_unidic
-        self.unidic_tagger = None
         if self.use_unidic:
             try:
-                unidic_dict_path = unidic.DICDIR
-                self.unidic_tagger = fugashi.Tagger(unidic_dict_path)
+                _get_unidic_tagger()  # Fail now, not on the first conversion, if UniDic cannot load.
             except (RuntimeError, OSError) as e:
                 logger.warning("UniDic initialization failed: %s", e)
                 self.use_unidic = False
 
+        if unidic_cache_size < 0:
+            raise ValueError(f"unidic_cache_size must be a non-negative integer, got {unidic_cache_size!r}.")
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be a positive integer, got {max_in_flight!r}.")
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_in_flight = max_in_flight
+        self._async_semaphores = weakref.WeakKeyDictionary()
+        self._in_flight = {}
+        self._worker_payload_cache = None
+
+        self._share_unidic_cache = share_unidic_cache
+        if not unidic_cache_size:
+            self._unidic_memo = None
+        elif share_unidic_cache:
+            self._unidic_memo = _get_shared_unidic_memo(unidic_cache_size)
+        else:
+            self._unidic_memo = _LRUCache(unidic_cache_size)
+
+        self._snapshot = None
+        self._snapshot_state = None  # (settings key, whether the snapshot matches those settings)
+        if snapshot is not None:
+            self._attach_snapshot(snapshot)
+
+    @property
+    def unidic_tagger(self):
+        """The calling thread's UniDic tagger, or None if UniDic is not used."""
+        return _get_unidic_tagger() if self.use_unidic else None
+
     @property
     def tokenizer(self):
-        return _get_tokenizer(self._sudachi_dict_type)
+        """The calling thread's Sudachi tokenizer."""
+        if not self._user_dict_sources:
+            return _get_tokenizer(self._sudachi_dict_type)
+        if self._user_dict_paths is None:
+            from .user_dict import build_user_dict
+
+            self._user_dict_paths = (build_user_dict(self._user_dict_sources, self._sudachi_dict_type),)
+        return _get_tokenizer(self._sudachi_dict_type, self._user_dict_paths)
+
+    @property
+    def custom_readings(self) -> dict:
+        """
+        Custom readings with "single", "compound" and (optionally) "context" tables.
+
+        Assigned mappings are copied into change-tracking tables, so mutating them in place
+        (e.g. ``custom_readings["compound"][surface] = reading``) is picked up automatically.
+        Read-only mappings such as a compiled readings index are not copied; changes are kept
+        in a per-instance overlay on top of them. The tables are mappings rather than dicts;
+        ``custom_readings.to_dict()`` returns plain dicts, e.g. for ``json.dump``.
+        """
+        return self._custom_readings
+
+    @custom_readings.setter
+    def custom_readings(self, value: dict) -> None:
+        self._custom_readings = _CustomReadings(value)
+
+    def _readings_version(self) -> tuple:
+        readings = self._custom_readings
+        return (readings.version, *(getattr(table, "version", None) for table in readings.values()))
+
+    def _settings_key(self) -> tuple:
+        # Everything that can change the output of an instance, for cache and coalescing keys.
+        return (
+            self.separator,
+            self._sudachi_split_mode_name,
+            self.use_custom_readings,
+            self.use_unidic,
+            self._readings_version(),
+        )
+
+    def _snapshot_fingerprint(self) -> dict:
+        """
+        Everything that can change the joined readings of a text, recorded in and checked against snapshots.
+        """
+        import hashlib
+        import json
+
+        from .user_dict import _system_dictionary_path
+
+        # The system dictionary's path and size, as build_user_dict uses, so an upgraded SudachiDict
+        # invalidates snapshots. None if it cannot be found; Sudachi then fails on the first conversion.
+        try:
+            system = _system_dictionary_path(self._sudachi_dict_type)
+            system_dict = [str(system), system.stat().st_size]
+        except (ModuleNotFoundError, OSError):
+            system_dict = None
+        readings = ""
+        if self.use_custom_readings:
+            tables = self._custom_readings.to_dict()
+            readings = hashlib.sha256(json.dumps(tables, sort_keys=True).encode("utf-8")).hexdigest()
+        user_dicts = []
+        for path in self._user_dict_sources:
+            with open(path, "rb") as f:
+                user_dicts.append(hashlib.sha256(f.read()).hexdigest())
+        return {
+            "format": 2,
+            "dict_type": self._sudachi_dict_type,
+            "system_dict": system_dict,
+            "split_mode": self._sudachi_split_mode_name,
+            "separator": self.separator,
+            "use_unidic": self.use_unidic,
+            "custom_readings": readings,
+            "user_dict": user_dicts,
+        }
+
+    def _attach_snapshot(self, path: str | os.PathLike) -> None:
+        from .snapshot import load_snapshot
+
+        snapshot = load_snapshot(path)
+        if snapshot.fingerprint != self._snapshot_fingerprint():
+            raise ValueError(
+                f"Snapshot {snapshot.path} was built with different settings (dictionary, split mode, "
+                "separator, UniDic, custom readings or user dictionaries); rebuild it with build_snapshot."
+            )
+        self._snapshot = snapshot
+        self._snapshot_state = (self._settings_key(), True)
+
+    def _snapshot_matches(self) -> bool:
+        # Settings such as the separator and custom readings can change after construction; re-check
+        # the fingerprint (once per change) so a stale snapshot is never consulted.
+        key = self._settings_key()
+        state = self._snapshot_state
+        if state[0] != key:
+            matches = self._snapshot.fingerprint == self._snapshot_fingerprint()
+            if not matches:
+                logger.warning("Settings changed; snapshot %s no longer applies and is ignored.", self._snapshot.path)
+            state = self._snapshot_state = (key, matches)
+        return state[1]
+
+    def cache_info(self) -> _CacheInfo:
+        """
+        Report result cache statistics.
+
+        Returns:
+            CacheInfo: Named tuple of hits, misses, maxsize and currsize, as with ``functools.lru_cache``.
+        """
+        if self._result_cache is None:
+            return _CacheInfo(0, 0, 0, 0)
+        return self._result_cache.info()
+
+    def cache_clear(self) -> None:
+        """
+        Clear the result cache and its statistics.
+        """
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def stats(self) -> dict:
+        """
+        Report cache statistics, and with ``instrument=True`` per-stage timings, for this instance.
+
+        Returns:
+            dict: "result_cache" and "unidic_cache" entries, each with hits, misses, maxsize,
+            currsize and hit_rate. When instrumented, also "stages" (calls and cumulative seconds
+            per stage), "tokens" (tokens produced) and "sources" (tokens per reading source).
+            "fast_path" reports the characters converted without Sudachi and their fraction of
+            all characters converted; nothing is counted with ``kana_fast_path=False``.
+        """
+        unidic_info = self._unidic_memo.info() if self._unidic_memo is not None else _CacheInfo(0, 0, 0, 0)
+        stats = {
+            "result_cache": _cache_stats(self.cache_info()),
+            "unidic_cache": _cache_stats(unidic_info),
+        }
+        with self._fast_path_lock:
+            fast, total = self._fast_path_counts
+        stats["fast_path"] = {"chars": fast, "total_chars": total, "fraction": fast / total if total else 0.0}
+        if self._instrumentation is not None:
+            stats.update(self._instrumentation.snapshot())
+        return stats
+
+    def stats_clear(self) -> None:
+        """
+        Reset the instrumentation and fast path counters. Cache statistics are cleared with ``cache_clear()``.
+        """
+        with self._fast_path_lock:
+            self._fast_path_counts = [0, 0]
+        if self._instrumentation is not None:
+            self._instrumentation.clear()
+
+    def close(self) -> None:
+        """
+        Release what this instance owns: shut down its default async executor and clear its caches.
+
+        Shared state (tokenizers, the UniDic tagger, readings indexes) is kept. The instance stays
+        usable; a new executor is started if it is needed again.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.cache_clear()
+        if self._unidic_memo is not None and not self._share_unidic_cache:
+            self._unidic_memo.clear()
+
+    @classmethod
+    def get(cls, **config) -> KanjiConv:
+        """
+        Return a shared instance for the given constructor arguments, creating it on first use.
+
+        Instances are pooled per configuration, so repeated calls (e.g. once per web request) cost a
+        dictionary lookup instead of a construction. Pooled instances are shared between callers and
+        threads: treat them as read-only and do not change their attributes or custom readings.
+
+        Args:
+            **config: Keyword arguments accepted by KanjiConv(); they must be hashable (lists are
+                converted to tuples).
+
+        Returns:
+            KanjiConv: The pooled instance.
+        """
+        return _instance_pool.get(config)
+
+    @staticmethod
+    def pool_stats() -> dict:
+        """
+        Report the instance pool used by ``KanjiConv.get`` and the memory it holds.
+
+        Returns:
+            dict: instances, maxsize, hits, misses and evictions of the pool, the number of loaded
+            Sudachi tokenizers and UniDic taggers, and approximate bytes held in "memory" by result
+            caches, UniDic memos and memory-mapped readings indexes of pooled instances.
+        """
+        return _instance_pool.stats()
+
+    @staticmethod
+    def pool_resize(maxsize: int) -> None:
+        """
+        Set the maximum number of pooled instances; least recently used ones beyond it are closed.
+        """
+        _instance_pool.resize(maxsize)
+
+    @staticmethod
+    def pool_clear() -> None:
+        """
+        Close and drop every pooled instance.
+        """
+        _instance_pool.clear()
+
+    def _get_compound_matcher(self) -> _CompoundMatcher:
+        compounds = self._custom_readings.get("compound", {})
+        version = getattr(compounds, "version", None)
+        state = self._compound_matcher
+        if state is None or state[0] != version:
+            # Shared read-only tables (bundled, compiled index) hash by identity; plain dicts do not.
+            shared = isinstance(compounds, _ReadingsOverlay) and type(compounds.base).__hash__ is object.__hash__
+            if shared and not compounds.modified:
+                matcher = _get_shared_compound_matcher(compounds.base)
+            elif isinstance(compounds, _ReadingsOverlay) and hasattr(compounds.base, "prefix_matches"):
+                # A compiled index stays in place; only this instance's changes are indexed.
+                matcher = _IndexCompoundMatcher(compounds.base, compounds._overrides, compounds._deleted)
+            else:
+                matcher = _CompoundMatcher(compounds)
+            # One assignment, so concurrent rebuilds never pair a matcher with another version.
+            state = self._compound_matcher = (version, matcher)
+        return state[1]
+
+    def tokenize(self, text: str) -> list:
+        """
+        Tokenize text and resolve the reading of every token.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            list[Token]: One record per token with its surface, reading, the source that
+            supplied the reading and its character offsets in ``text``.
+        """
+        return self._tokenize(text)
+
+    def _tokenize_morphemes(self, text: str, context: str) -> tuple:
+        """
+        Sudachi morphemes of text, tokenized after context (the break preceding text, if any).
+
+        Returns the morphemes of text and the surface of the token before them. Should a token
+        span the end of context, text is tokenized on its own instead.
+        """
+        mode = _get_split_mode(self._sudachi_split_mode_name)
+        if context:
+            morphemes = self.tokenizer.tokenize(context + text, mode)
+            position = 0
+            for index, morpheme in enumerate(morphemes):
+                position += len(morpheme.surface())
+                if position == len(context):
+                    return list(morphemes)[index + 1 :], morpheme.surface()
+                if position > len(context):
+                    break
+        return self.tokenizer.tokenize(text, mode), ""
+
+    def _tokenize(self, text: str, context: str = "") -> list:
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            started = perf_counter()
+            stages = {"compound": 0.0, "tokenize": 0.0, "unidic": 0.0, "custom": 0.0}
+
+        # Try custom compound conversion
+        offset_map = None
+        if self.use_custom_readings:
+            text, offset_map = self._get_compound_matcher().rewrite(text)
+        if instrumentation is not None:
+            rewritten = perf_counter()
+            stages["compound"] = rewritten - started
+
+        # Tokenize using Sudachi and get readings
+        morphemes, previous = self._tokenize_morphemes(text, context)
+        if instrumentation is not None:
+            stages["tokenize"] = perf_counter() - rewritten
+        single_readings = self.custom_readings.get("single", {}) if self.use_custom_readings else {}
+        context_rules = self.custom_readings.get("context", {}) if self.use_custom_readings else {}
+        has_user_dict = bool(self._user_dict_sources)
+
+        # Look up every token without a Sudachi reading in UniDic at once, rather than one tagger call per token.
+        unidic_readings = {}
+        if self.use_unidic and self.unidic_tagger:
+            if instrumentation is not None:
+                fallback_started = perf_counter()
+            unresolved = []
+            for morpheme in morphemes:
+                surface = morpheme.surface()
+                reading = morpheme.reading_form()
+                if (not reading or reading == surface) and not (surface.startswith("[") and surface.endswith("]")):
+                    unresolved.append(surface)
+            if unresolved:
+                unidic_readings = self._get_unidic_readings(unresolved)
+            if instrumentation is not None:
+                stages["unidic"] = perf_counter() - fallback_started
+
+        tokens = []
+        position = 0
+
+        # Process each token
+        for index, morpheme in enumerate(morphemes):
+            surface = morpheme.surface()
+            start = position
+            position += len(surface)
+            end = position
+            source = TokenSource.SUDACHI
+
+            if surface.startswith("[") and surface.endswith("]"):
+                # Process custom readings in brackets
+                reading = surface[1:-1]  # Remove brackets
+                source = TokenSource.BRACKET
+            else:
+                reading = morpheme.reading_form()
+                has_no_reading = not reading or reading == surface
+                if has_user_dict and morpheme.dictionary_id() > 0:
+                    # Dictionary 0 is the system dictionary; user dictionaries come after it.
+                    source = TokenSource.CUSTOM
+
+                # If reading is not available, use UniDic
+                if has_no_reading and unidic_readings.get(surface):
+                    reading = unidic_readings[surface]
+                    has_no_reading = False
+                    source = TokenSource.UNIDIC
+
+                # If still no reading is available, use custom dictionary
+                if has_no_reading:
+                    if instrumentation is not None:
+                        fallback_started = perf_counter()
+                    if surface in single_readings:
+                        candidates = single_readings[surface]
+                        rules = context_rules.get(surface)
+                        if rules and len(candidates) > 1:
+                            following = morphemes[index + 1].surface() if index + 1 < len(morphemes) else ""
+                            part_of_speech = morpheme.part_of_speech()[0] if "pos" in rules else ""
+                            reading = _select_reading(candidates, rules, previous, following, part_of_speech)
+                        else:
+                            reading = candidates[0]
+                        source = TokenSource.CUSTOM
+                    if instrumentation is not None:
+                        stages["custom"] += perf_counter() - fallback_started
+
+                if not reading:
+                    reading = surface
+                    source = TokenSource.PASSTHROUGH
+
+            if offset_map is not None:
+                start, end, in_compound = offset_map.map(start, end)
+                if in_compound:
+                    source = TokenSource.CUSTOM
+            tokens.append(Token(surface, reading, source, start, end))
+            previous = surface
+
+        if instrumentation is not None:
+            instrumentation.record(stages, tokens)
+        return tokens
+
+    def _get_readings(self, text: str, context: str = "") -> list:
+        return [token.reading for token in self._tokenize(text, context)]
+
+    def _joined_readings(self, text: str, context: str = "") -> str:
+        """
+        Readings of text joined with the separator, taking the kana fast path where it applies.
+
+        The fast path only runs when its output cannot differ from Sudachi's: with an empty separator
+        (so segmentation does not show), without UniDic or user dictionaries, and for phrases that no
+        custom reading applies to. Texts in the snapshot, if any, are looked up without tokenizing;
+        the snapshot holds readings of whole texts, so it is skipped when text follows a context.
+        """
+        if self._snapshot is not None and not context and self._snapshot_matches():
+            readings = self._snapshot.get(text)
+            if readings is not None:
+                return readings
+
+        if not self.kana_fast_path:
+            return self.separator.join(self._get_readings(text, context))
+        if not (self.separator == "" and not self.use_unidic and not self._user_dict_sources):
+            self._count_fast_path(0, len(text))
+            return self.separator.join(self._get_readings(text, context))
+
+        blocked = self._get_fast_path_blocked() if self.use_custom_readings else frozenset()
+        matcher = self._get_compound_matcher() if self.use_custom_readings else None
+        pieces = []
+        position = 0
+        fast = 0
+        for match in _KANA_PHRASE.finditer(text):
+            phrase = match.group()
+            if not blocked.isdisjoint(phrase) or (matcher is not None and next(matcher.finditer(phrase), None)):
+                continue
+            if match.start() > position:
+                pieces.append("".join(self._get_readings(text[position : match.start()], context)))
+            pieces.append(phrase.translate(_KATAKANA_TABLE))
+            fast += len(phrase)
+            position = match.end()
+            context = ""  # Only the first piece follows the context; later ones follow a kana phrase.
+        if position < len(text):
+            pieces.append("".join(self._get_readings(text[position:], context)))
+        self._count_fast_path(fast, len(text))
+        return "".join(pieces)
+
+    def _get_fast_path_blocked(self) -> frozenset:
+        # Kana with a custom single reading must go through Sudachi, where that reading can apply.
+        single = self._custom_readings.get("single", {})
+        version = getattr(single, "version", None)
+        state = self._fast_path_blocked
+        if state is None or state[0] != version:
+            blocked = frozenset(char for surface in single for char in surface if _KANA_PHRASE.fullmatch(char))
+            state = self._fast_path_blocked = (version, blocked)
+        return state[1]
+
+    def _count_fast_path(self, fast: int, total: int) -> None:
+        with self._fast_path_lock:
+            self._fast_path_counts[0] += fast
+            self._fast_path_counts[1] += total
+
+    def _worker_config(self) -> tuple:
+        """
+        Picklable description of this instance, used to build identical converters in worker processes.
+        """
+        kwargs = {
+            "sudachi_dict_type": self._sudachi_dict_type,
+            "separator": self.separator,
+            "use_custom_readings": self.use_custom_readings,
+            "use_unidic": self.use_unidic,
+            "sudachi_split_mode": self._sudachi_split_mode_name,
+            "cache_size": self._result_cache.maxsize if self._result_cache is not None else 0,
+            "unidic_cache_size": self._unidic_memo.maxsize if self._unidic_memo is not None else 0,
+            "user_dict": list(self._user_dict_sources) or None,
+            "kana_fast_path": self.kana_fast_path,
+            "snapshot": self._snapshot.path if self._snapshot is not None and self._snapshot_matches() else None,
+        }
+        # Shared tables pickle by reference (bundled name or index path), so only overlays are copied.
+        custom_readings = dict(self.custom_readings)
+        return kwargs, custom_readings
+
+    def _get_unidic_readings(self, surfaces: Iterable[str]) -> dict:
+        """
+        Look up the UniDic readings of several surfaces, memoizing the results (including failures).
+
+        Surfaces missing from the memo are joined with spaces, which MeCab never includes in a
+        node, and analysed with a single tagger call; the nodes are mapped back to their surface
+        by character offset. If that call fails, each surface is looked up on its own, so one bad
+        surface does not cost the others their readings.
+
+        Args:
+            surfaces (Iterable[str]): Surface forms of tokens without a Sudachi reading.
+
+        Returns:
+            dict: Each surface mapped to its UniDic kana reading, or to an empty string if UniDic has none.
+        """
+        memo = self._unidic_memo
+        readings = {}
+        missing = []
+        for surface in dict.fromkeys(surfaces):
+            reading = memo.get(surface) if memo is not None else None
+            if reading is None:
+                missing.append(surface)
+            else:
+                readings[surface] = reading
+        if not missing:
+            return readings
+
+        parts = [[] for _ in missing]
+        try:
+            # Run morphological analysis with UniDic
+            ends = list(itertools.accumulate(len(surface) + 1 for surface in missing))
+            position = 0
+            index = 0
+            for node in self.unidic_tagger(" ".join(missing)):
+                position += len(getattr(node, "white_space", "") or "")
+                while index < len(ends) and position >= ends[index]:
+                    index += 1
+                kana = getattr(node.feature, "kana", None)
+                if kana and index < len(parts):
+                    parts[index].append(kana)
+                position += len(node.surface)
+        except Exception:
+            if len(missing) > 1:
+                logger.debug("Batched UniDic lookup failed for %r; retrying each surface", missing, exc_info=True)
+                for surface in missing:
+                    readings.update(self._get_unidic_readings((surface,)))
+                return readings
+            # Ignore errors with UniDic and continue
+            logger.debug("UniDic lookup failed for %r", missing, exc_info=True)
+            parts = [[]]
+
+        for surface, kana in zip(missing, parts):
+            reading = "".join(kana)
+            readings[surface] = reading
+            if memo is not None:
+                memo.put(surface, reading)
+        return readings
+
+    def _worker_payload(self) -> tuple:
+        """
+        Pickled worker config and its digest, so worker processes can rebuild and reuse this converter.
+        """
+        settings = self._settings_key()
+        if self._worker_payload_cache is None or self._worker_payload_cache[0] != settings:
+            import hashlib
+            import pickle
+
+            payload = pickle.dumps(self._worker_config())
+            self._worker_payload_cache = (settings, (hashlib.sha1(payload).hexdigest(), payload))
+        return self._worker_payload_cache[1]
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Each thread has its own tokenizer, so conversions can run concurrently; they scale with
+            # threads on free-threaded Python and wherever the GIL is released.
+            self._executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="kanjiconv")
+        return self._executor
+
+    async def _aconvert(self, mode: str, text: str) -> str:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        key = (loop, mode, text, self._settings_key())
+        future = self._in_flight.get(key)
+        if future is None:
+            # Concurrent requests for the same conversion share a single execution.
+            future = loop.create_task(self._arun(loop, mode, text))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _arun(self, loop: asyncio.AbstractEventLoop, mode: str, text: str) -> str:
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(self._max_in_flight)
+        async with semaphore:
+            executor = self._get_executor()
+            if isinstance(executor, ProcessPoolExecutor):
+                return await loop.run_in_executor(executor, _convert_in_process, self._worker_payload(), mode, text)
+            return await loop.run_in_executor(executor, getattr(self, f"to_{mode}"), text)
+
+    async def ato_hiragana(self, text: str) -> str:
+        """
+        Asynchronous counterpart of ``to_hiragana`` that runs the conversion on the configured executor.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            str: The converted text in Hiragana.
+        """
+        return await self._aconvert("hiragana", text)
+
+    async def ato_katakana(self, text: str) -> str:
+        """
+        Asynchronous counterpart of ``to_katakana`` that runs the conversion on the configured executor.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            str: The converted text in Katakana.
+        """
+        return await self._aconvert("katakana", text)
+
+    async def ato_roman(self, text: str) -> str:
+        """
+        Asynchronous counterpart of ``to_roman`` that runs the conversion on the configured executor.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            str: The converted text in Roman characters.
+        """
+        return await self._aconvert("roman", text)
+
+    def convert_many(
+        self,
+        texts: Iterable[str],
+        modes: Iterable[str] = _MODES,
+        workers: int | None = None,
+        chunksize: int = 256,
+    ) -> Iterator[dict]:
+        """
+        Convert many texts into several formats, tokenizing each text only once.
+
+        Results are yielded lazily in input order, so arbitrarily large inputs can be
+        streamed through with flat memory usage.
+
+        Args:
+            texts (Iterable[str]): The input texts.
+            modes (Iterable[str]): Output formats to produce, any of "hiragana", "katakana"
+                and "roman". Defaults to all of them.
+            workers (int | None): Number of worker processes. When greater than 1, chunks of
+                texts are converted in a process pool, each worker building its own tokenizer
+                (and UniDic tagger) once. Defaults to converting in the current process.
+            chunksize (int): Number of texts sent to a worker at a time.
+
+        Yields:
+            dict: Mapping of each requested mode to the converted text.
+        """
+        modes = tuple(dict.fromkeys(modes))
+        invalid = [mode for mode in modes if mode not in _MODES]
+        if invalid or not modes:
+            raise ValueError(f"Invalid modes: {invalid!r}. Must be one or more of {', '.join(_MODES)}.")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers!r}.")
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize!r}.")
+
+        if workers is not None and workers > 1:
+            yield from _convert_parallel(self._worker_config(), texts, modes, workers, chunksize)
+            return
+
+        converters = [(mode, getattr(KanjiConv, f"to_{mode}").__wrapped__) for mode in modes]
+
+        for text in texts:
+            yield self._convert(text, converters)
+
+    def convert_stream(
+        self, document: str | Iterable[str], mode: str = "roman", chunk_size: int = 4096
+    ) -> Iterator[str]:
+        """
+        Convert a long document piece by piece, so memory is bounded by chunk_size rather than document size.
+
+        The document is split at sentence ends (or, failing that, at commas and whitespace) and each
+        chunk is converted separately, tokenized after the break that ends the previous chunk so
+        Sudachi sees the same context as in the whole document. The concatenated output equals
+        converting the whole document at once, unless a run of chunk_size characters contains no
+        break point at all and has to be split hard, or a custom compound spans a sentence end.
+
+        Args:
+            document (str | Iterable[str]): The text, or an iterable of text pieces such as an open file.
+            mode (str): Output format, one of "hiragana", "katakana" and "roman".
+            chunk_size (int): Maximum number of characters tokenized at once. Keep it well below
+                Sudachi's input size limit.
+
+        Yields:
+            str: Consecutive pieces of the converted document.
+        """
+        if mode not in _MODES:
+            raise ValueError(f"Invalid mode: {mode!r}. Must be one of {', '.join(_MODES)}.")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}.")
+        if isinstance(document, str):
+            document = (document,)
+
+        converters = ((mode, getattr(KanjiConv, f"to_{mode}").__wrapped__),)
+        separator = None
+        context = ""
+        for chunk in _document_chunks(document, chunk_size):
+            if separator is None:
+                # Readings of the whole document are joined with the separator, chunks included.
+                separator = converters[0][1](self, self.separator)
+            else:
+                yield separator
+            yield self._convert(chunk, converters, context)[mode]
+            context = _left_context(chunk)
+
+    def _convert(self, text: str, converters, context: str = "") -> dict:
+        """
+        Convert text with each of the given ``(key, function)`` converters, consulting the result cache.
+
+        context is the text before text, tokenized with it but not converted (see ``_left_context``).
+        """
+        cache = self._result_cache
+        if cache is None:
+            joined_readings = self._joined_readings(text, context)
+            return {key: self._apply(convert, joined_readings) for key, convert in converters}
+
+        settings = self._settings_key()
+        results = {}
+        joined_readings = None
+        for key, convert in converters:
+            cache_key = (text, convert, settings) if not context else (text, convert, settings, context)
+            result = cache.get(cache_key, _MISSING)
+            if result is _MISSING:
+                if joined_readings is None:
+                    joined_readings = self._joined_readings(text, context)
+                result = self._apply(convert, joined_readings)
+                cache.put(cache_key, result)
+            results[key] = result
+        return results
+
+    def _apply(self, convert: Callable, joined_readings: str) -> str:
+        """
+        Run one output pass (``to_*`` without parsing) over joined readings, timing it if instrumented.
+        """
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            return convert(self, joined_readings)
+        start = perf_counter()
+        result = convert(self, joined_readings)
+        instrumentation.record({convert.__name__[3:]: perf_counter() - start})
+        return result
 
     @parse_text
     def to_hiragana(self, text: str) -> str:
@@ -192,14 +1679,7 @@ class KanjiConv:
         Returns:
             str: The converted text with Hiragana characters.
         """
-        hiragana_text = ""
-        for char in text:
-            # Convert Katakana characters to Hiragana by adjusting their Unicode code point
-            if "ァ" <= char <= "ン":
-                hiragana_text += chr(ord(char) - 0x60)
-            else:
-                hiragana_text += char
-        return hiragana_text
+        return text.translate(_HIRAGANA_TABLE)
 
     @parse_text
     def to_katakana(self, text: str) -> str:
@@ -225,27 +1705,170 @@ class KanjiConv:
         Returns:
             str: The Romanized representation of the input text.
         """
-        roman_text = ""
-        i = 0
-        while i < len(text):
-            # Check for combined small Katakana to handle contracted sounds (拗音)
-            if (
-                i + 1 < len(text)
-                and text[i] in self.kana["full_katakana"]
-                and text[i + 1] in self.kana["small_katakana"]
-            ):
-                combined = text[i] + text[i + 1]
-                if combined in self.kana["katakana2roman"]:
-                    roman_text += self.kana["katakana2roman"][combined]
-                    i += 2  # Consume two characters for contracted sounds
-                    continue
-
-            # Process normal Katakana characters
-            char = text[i]
-
-            if "ァ" <= char <= "ン" or "、" <= char <= "ー":
-                roman_text += self.kana["katakana2roman"].get(char, "")
-            else:
-                roman_text += char
-            i += 1
-        return roman_text
+        return self._romaji(text)
+
+
+def _config_key(config: dict) -> tuple:
+    return tuple(sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in config.items()))
+
+
+class _InstancePool:
+    """Bounded registry of shared KanjiConv instances keyed by configuration, behind KanjiConv.get."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._instances = OrderedDict()
+        self._building = {}  # Key -> Event set once the instance being built for that key is pooled.
+        self._lock = threading.Lock()
+
+    def get(self, config: dict) -> KanjiConv:
+        key = _config_key(config)
+        while True:
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is not None:
+                    self._instances.move_to_end(key)
+                    self.hits += 1
+                    return instance
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # Another thread is building this configuration; wait for it instead of building a duplicate.
+            building.wait()
+
+        # Built outside the lock: construction can be slow (UniDic loads eagerly, a snapshot is
+        # checked against every table), and other configurations must not wait for it.
+        try:
+            instance = KanjiConv(**config)
+        except BaseException:
+            with self._lock:
+                del self._building[key]
+            building.set()
+            raise
+        with self._lock:
+            del self._building[key]
+            self._instances[key] = instance
+            evicted = self._evict()
+        building.set()
+        for old in evicted:
+            old.close()
+        return instance
+
+    def _evict(self) -> list:
+        evicted = []
+        while len(self._instances) > self.maxsize:
+            evicted.append(self._instances.popitem(last=False)[1])
+            self.evictions += 1
+        return evicted
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be a non-negative integer, got {maxsize!r}.")
+        with self._lock:
+            self.maxsize = maxsize
+            evicted = self._evict()
+        for old in evicted:
+            old.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            instances = list(self._instances.values())
+            self._instances.clear()
+            self.hits = self.misses = self.evictions = 0
+        for old in instances:
+            old.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            instances = list(self._instances.values())
+            stats = {
+                "instances": len(instances),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+        # Shared objects (memos, index tables) are counted once.
+        memos = {id(i._unidic_memo): i._unidic_memo for i in instances if i._unidic_memo is not None}
+        tables = {id(t.base): t.base for i in instances for t in i.custom_readings.values() if hasattr(t, "base")}
+        stats["dictionaries"] = _get_dictionary.cache_info().currsize
+        stats["tokenizers"] = _tokenizers.created
+        stats["unidic_taggers"] = _unidic_taggers.created
+        stats["memory"] = {
+            "result_cache_bytes": sum(i._result_cache.nbytes() for i in instances if i._result_cache is not None),
+            "unidic_cache_bytes": sum(memo.nbytes() for memo in memos.values()),
+            "readings_index_bytes": sum(getattr(table, "nbytes", 0) for table in tables.values()),
+        }
+        return stats
+
+
+_instance_pool = _InstancePool(maxsize=32)
+
+
+# Converter owned by a process-pool worker, built once by _init_worker.
+_worker_converter = None
+
+
+# Converters serving async requests in executor processes, keyed by worker payload digest.
+_process_converters = _LRUCache(8)
+
+
+def _build_converter(config: tuple) -> KanjiConv:
+    kwargs, custom_readings = config
+    kwargs = dict(kwargs)
+    snapshot = kwargs.pop("snapshot", None)
+    converter = KanjiConv(**kwargs)
+    converter.custom_readings = custom_readings
+    if snapshot is not None:
+        # Only after the custom readings are in place, since the snapshot is tied to them.
+        converter._attach_snapshot(snapshot)
+    converter.tokenizer  # Load the Sudachi dictionary now rather than on the first conversion.
+    return converter
+
+
+def _init_worker(config: tuple) -> None:
+    global _worker_converter
+    _worker_converter = _build_converter(config)
+
+
+def _convert_in_process(payload: tuple, mode: str, text: str) -> str:
+    digest, data = payload
+    converter = _process_converters.get(digest)
+    if converter is None:
+        import pickle
+
+        converter = _build_converter(pickle.loads(data))
+        _process_converters.put(digest, converter)
+    return getattr(converter, f"to_{mode}")(text)
+
+
+def _convert_chunk(chunk: list, modes: tuple) -> list:
+    return list(_worker_converter.convert_many(chunk, modes))
+
+
+def _convert_parallel(
+    config: tuple, texts: Iterable[str], modes: tuple, workers: int, chunksize: int
+) -> Iterator[dict]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    texts = iter(texts)
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,))
+    pending = deque()
+    try:
+        while True:
+            # Keep a bounded number of chunks in flight so memory stays flat on large inputs.
+            while len(pending) < workers * 2:
+                chunk = list(itertools.islice(texts, chunksize))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_convert_chunk, chunk, modes))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,277 @@
+"""Compiled, memory-mapped custom readings index.
+
+``compile_readings`` turns a readings dictionary (the JSON format of ``kanji_readings.json`` or a
+TSV file) into a compact binary file. ``load_readings_index`` memory-maps that file read-only,
+so every KanjiConv instance and worker process shares the same pages instead of holding its
+own copy of a large dictionary.
+
+File layout (little-endian)::
+
+    magic "KCRIDX\\0\\1"
+    for each table ("single", then "compound"):
+        entry count, key blob size, value blob size     (uint32 each)
+        key offsets[count + 1], value offsets[count + 1] (uint32 each)
+        key blob, value blob                            (UTF-8, keys sorted)
+
+Values of the "single" table hold every candidate reading separated by U+001F.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+
+__all__ = ["ReadingsIndex", "compile_readings", "load_readings_index"]
+
+_MAGIC = b"KCRIDX\x00\x01"
+_TABLE_NAMES = ("single", "compound")
+_TABLE_HEADER = struct.Struct("<III")
+_OFFSET = struct.Struct("<I")
+_READING_SEPARATOR = "\x1f"
+
+
+def _read_tsv(path: str) -> dict:
+    """
+    Read ``surface<TAB>reading[<TAB>reading...]`` lines.
+
+    Single-character surfaces go to the "single" table with all their readings, longer
+    surfaces to the "compound" table with their first reading. Blank lines and lines
+    starting with "#" are ignored.
+    """
+    data = {"single": {}, "compound": {}}
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("#"):
+                continue
+            surface, *readings = line.split("\t")
+            if not surface or not readings:
+                raise ValueError(f"{path}:{line_number}: expected surface and at least one reading")
+            if len(surface) == 1:
+                data["single"].setdefault(surface, []).extend(readings)
+            else:
+                data["compound"][surface] = readings[0]
+    return data
+
+
+def _encode_table(entries: dict, multi_valued: bool) -> bytes:
+    keys = bytearray()
+    values = bytearray()
+    key_offsets = [0]
+    value_offsets = [0]
+    for surface in sorted(entries):
+        value = entries[surface]
+        if multi_valued:
+            value = _READING_SEPARATOR.join(value)
+        keys += surface.encode("utf-8")
+        values += value.encode("utf-8")
+        key_offsets.append(len(keys))
+        value_offsets.append(len(values))
+
+    count = len(entries)
+    offsets = struct.pack(f"<{count + 1}I{count + 1}I", *key_offsets, *value_offsets)
+    return _TABLE_HEADER.pack(count, len(keys), len(values)) + offsets + bytes(keys) + bytes(values)
+
+
+def compile_readings(source: str | os.PathLike, output: str | os.PathLike) -> None:
+    """
+    Compile a readings dictionary into a binary index.
+
+    Args:
+        source (str | os.PathLike): A JSON file with "single" and "compound" tables (the format of
+            the bundled kanji_readings.json), or a ``.tsv`` file of ``surface<TAB>reading`` lines.
+        output (str | os.PathLike): Path of the index file to write.
+    """
+    source = os.fspath(source)
+    if source.endswith(".tsv"):
+        data = _read_tsv(source)
+    else:
+        with open(source, encoding="utf-8") as f:
+            data = json.load(f)
+
+    payload = _MAGIC + _encode_table(data.get("single", {}), True) + _encode_table(data.get("compound", {}), False)
+    # Write to a temporary file and rename, so processes never map a half-written index.
+    temporary = f"{os.fspath(output)}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(payload)
+    os.replace(temporary, output)
+
+
+class _MappedTable(Mapping):
+    """Read-only mapping over one table of a memory-mapped index, looked up by binary search."""
+
+    __hash__ = object.__hash__
+
+    def __init__(self, path: str, name: str, buffer: mmap.mmap, offset: int, multi_valued: bool) -> None:
+        self._path = path
+        self._name = name
+        self._buffer = buffer
+        self._multi_valued = multi_valued
+        self._count, keys_size, values_size = _TABLE_HEADER.unpack_from(buffer, offset)
+        self._key_offsets = offset + _TABLE_HEADER.size
+        self._value_offsets = self._key_offsets + (self._count + 1) * _OFFSET.size
+        self._keys = self._value_offsets + (self._count + 1) * _OFFSET.size
+        self._values = self._keys + keys_size
+        self.end = self._values + values_size
+        self.nbytes = self.end - offset
+        self._first_ranges = None  # First character -> index range of the keys starting with it.
+
+    def _offset(self, table: int, i: int) -> int:
+        return _OFFSET.unpack_from(self._buffer, table + i * _OFFSET.size)[0]
+
+    def _key(self, i: int) -> bytes:
+        start = self._keys + self._offset(self._key_offsets, i)
+        return self._buffer[start : self._keys + self._offset(self._key_offsets, i + 1)]
+
+    def _value(self, i: int):
+        start = self._values + self._offset(self._value_offsets, i)
+        end = self._values + self._offset(self._value_offsets, i + 1)
+        value = self._buffer[start:end].decode("utf-8")
+        return value.split(_READING_SEPARATOR) if self._multi_valued else value
+
+    def _lower_bound(self, key: bytes, low: int, high: int) -> int:
+        """First index in [low, high) whose key is not less than key, or high."""
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _find(self, key: bytes) -> int:
+        low = self._lower_bound(key, 0, self._count)
+        if low < self._count and self._key(low) == key:
+            return low
+        return -1
+
+    def _first_character_ranges(self) -> dict:
+        ranges = self._first_ranges
+        if ranges is None:
+            # One binary search per distinct first character, skipping over the keys in between.
+            ranges = {}
+            i = 0
+            while i < self._count:
+                key = self._key(i)
+                if not key:
+                    i += 1
+                    continue
+                char = key.decode("utf-8")[0]
+                # 0xff never occurs in UTF-8, so every key starting with char sorts before this bound.
+                end = self._lower_bound(char.encode("utf-8") + b"\xff", i, self._count)
+                ranges[char] = (i, end)
+                i = end
+            self._first_ranges = ranges
+        return ranges
+
+    def first_characters(self) -> str:
+        """The distinct first characters of the keys."""
+        return "".join(self._first_character_ranges())
+
+    def prefix_matches(self, text: str, start: int) -> Iterator[tuple]:
+        """
+        Yield ``(end, value)`` for every key equal to ``text[start:end]``, shortest first.
+
+        The range of keys sharing the growing prefix is narrowed by binary search on the mapped
+        table, so nothing is copied out of the index.
+        """
+        bounds = self._first_character_ranges().get(text[start : start + 1])
+        if bounds is None:
+            return
+        low, high = bounds
+        prefix = text[start].encode("utf-8")
+        end = start + 1
+        while True:
+            if self._key(low) == prefix:
+                yield end, self._value(low)
+            if end == len(text):
+                return
+            prefix += text[end].encode("utf-8", "surrogatepass")
+            end += 1
+            low = self._lower_bound(prefix, low, high)
+            high = self._lower_bound(prefix + b"\xff", low, high)
+            if low == high:
+                return
+
+    def __getitem__(self, surface):
+        if not isinstance(surface, str):
+            raise KeyError(surface)
+        i = self._find(surface.encode("utf-8"))
+        if i < 0:
+            raise KeyError(surface)
+        return self._value(i)
+
+    def __contains__(self, surface) -> bool:
+        return isinstance(surface, str) and self._find(surface.encode("utf-8")) >= 0
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._key(i).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __reduce__(self):
+        # Pickle by reference: worker processes map the same file instead of receiving a copy.
+        return _load_table, (self._path, self._name)
+
+
+class ReadingsIndex:
+    """A compiled readings index, memory-mapped read-only."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = os.path.abspath(os.fspath(path))
+        with open(self.path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[: len(_MAGIC)] != _MAGIC:
+            self._buffer.close()
+            raise ValueError(f"{self.path} is not a kanjiconv readings index")
+
+        offset = len(_MAGIC)
+        tables = {}
+        for name in _TABLE_NAMES:
+            tables[name] = _MappedTable(self.path, name, self._buffer, offset, multi_valued=name == "single")
+            offset = tables[name].end
+        self.single = tables["single"]
+        self.compound = tables["compound"]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the mapped file in bytes."""
+        return len(self._buffer)
+
+
+def _file_key(path: str | os.PathLike) -> tuple:
+    """Cache key of a mapped file: a file rewritten through ``os.replace`` gets a new key."""
+    path = os.path.abspath(os.fspath(path))
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_ino
+
+
+# Bounded, so rewriting a file over and over does not keep every old mapping alive.
+@lru_cache(maxsize=64)
+def _load_index(path: str, mtime_ns: int, inode: int) -> ReadingsIndex:
+    return ReadingsIndex(path)
+
+
+def load_readings_index(path: str | os.PathLike) -> ReadingsIndex:
+    """
+    Open a compiled readings index, sharing one mapping per file within the process.
+
+    A file rewritten by compile_readings is mapped again, so the new readings are seen.
+
+    Args:
+        path (str | os.PathLike): Path written by compile_readings.
+
+    Returns:
+        ReadingsIndex: The index, whose ``single`` and ``compound`` tables are read-only mappings.
+    """
+    return _load_index(*_file_key(path))
+
+
+def _load_table(path: str, name: str) -> _MappedTable:
+    return getattr(load_readings_index(path), name)
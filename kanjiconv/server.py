@@ -0,0 +1,291 @@
+"""Conversion daemon that keeps warm KanjiConv instances behind a Unix-domain socket.
+
+Start it with ``kanjiconv serve``. While it is running, the ``kanjiconv`` CLI sends its
+conversions to the daemon instead of loading the Sudachi dictionary in every process.
+
+The protocol is one JSON object per line in each direction. A request looks like::
+
+    {"mode": "roman", "texts": ["東京"], "dict_type": "full", "separator": " ", "split_mode": "C",
+     "use_unidic": false, "use_custom_readings": true}
+
+and is answered with ``{"results": ["toukyou"]}`` or ``{"error": "message"}``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+
+from .kanjiconv import KanjiConv, _LRUCache
+
+__all__ = ["DaemonClient", "DaemonConverter", "connect", "default_socket_path", "serve"]
+
+logger = logging.getLogger(__name__)
+
+_MODES = ("hiragana", "katakana", "roman")
+
+# Settings a request may carry, with the CLI defaults.
+_DEFAULT_SETTINGS = {
+    "dict_type": "full",
+    "separator": " ",
+    "split_mode": "C",
+    "use_unidic": False,
+    "use_custom_readings": True,
+}
+
+# Converters kept for the most recently used request settings. Clients choose the separator freely,
+# so the number of distinct settings is unbounded.
+_MAX_CONVERTERS = 16
+
+
+def default_socket_path() -> str:
+    """
+    Socket path from $KANJICONV_SOCKET, or a path in a directory only the current user can access:
+    $XDG_RUNTIME_DIR, or a 0700 per-user directory in the temp directory.
+    """
+    path = os.environ.get("KANJICONV_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "kanjiconv.sock")
+    return os.path.join(tempfile.gettempdir(), f"kanjiconv-{os.getuid()}", "daemon.sock")
+
+
+def _is_trusted_directory(path: str) -> bool:
+    """Whether only the current user (or root) can add, remove or rename entries in the directory."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    if info.st_uid not in (os.getuid(), 0):
+        return False
+    # Group/other-writable directories are only safe with the sticky bit, like /tmp.
+    return not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH) or bool(info.st_mode & stat.S_ISVTX)
+
+
+def _is_trusted_socket(path: str) -> bool:
+    """
+    Whether the socket was created by the current user and only they can connect to it.
+
+    Another local user could otherwise create the socket first and receive every converted text.
+    """
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == os.getuid()
+        and not info.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+        and _is_trusted_directory(os.path.dirname(os.path.abspath(path)))
+    )
+
+
+def _prepare_socket_directory(socket_path: str) -> None:
+    """Create the socket's directory as a private 0700 directory if needed, and check it is trusted."""
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not _is_trusted_directory(directory):
+        raise RuntimeError(f"Refusing to create the daemon socket in {directory}: other users can modify it")
+
+
+class _ConversionServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, sudachi_dict_type: str) -> None:
+        # Dictionary preloaded at startup; requests still choose theirs with "dict_type".
+        self.sudachi_dict_type = sudachi_dict_type
+        self._converters = _LRUCache(_MAX_CONVERTERS)
+        self._lock = threading.Lock()
+        super().__init__(socket_path, _ConversionHandler)
+
+    def server_bind(self) -> None:
+        # Create the socket owner-only from the start, rather than narrowing it after bind.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def get_converter(self, settings: dict) -> KanjiConv:
+        key = tuple(settings[name] for name in _DEFAULT_SETTINGS)
+        with self._lock:
+            converter = self._converters.get(key)
+            if converter is None:
+                converter = KanjiConv(
+                    sudachi_dict_type=settings["dict_type"],
+                    separator=settings["separator"],
+                    use_custom_readings=settings["use_custom_readings"],
+                    use_unidic=settings["use_unidic"],
+                    sudachi_split_mode=settings["split_mode"],
+                )
+                self._converters.put(key, converter)
+            return converter
+
+    def convert(self, request: dict) -> list:
+        mode = request.get("mode", "roman")
+        if mode not in _MODES:
+            raise ValueError(f"Invalid mode: {mode!r}. Must be one of {', '.join(_MODES)}.")
+        settings = {name: request.get(name, default) for name, default in _DEFAULT_SETTINGS.items()}
+        # Converters are thread-safe (per-thread tokenizers), so connections convert concurrently.
+        converter = self.get_converter(settings)
+        return [result[mode] for result in converter.convert_many(request["texts"], modes=(mode,))]
+
+
+class _ConversionHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = {"results": self.server.convert(json.loads(line))}
+            except Exception as e:
+                logger.debug("Request failed", exc_info=True)
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def _is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: str | None = None, sudachi_dict_type: str = "full", preload: bool = True) -> None:
+    """
+    Run the conversion daemon until interrupted.
+
+    Args:
+        socket_path (str | None): Path of the Unix-domain socket. Defaults to default_socket_path().
+        sudachi_dict_type (str): Sudachi dictionary to preload. Each request names the dictionary it
+            needs ("full" when omitted), so clients never get another dictionary's readings.
+        preload (bool): Load the dictionary for the default settings before accepting requests.
+    """
+    socket_path = socket_path or default_socket_path()
+    _prepare_socket_directory(socket_path)
+    if os.path.lexists(socket_path):
+        if not _is_trusted_socket(socket_path):
+            raise RuntimeError(
+                f"{socket_path} exists but is not a private socket of this user; remove it or use another path"
+            )
+        if _is_listening(socket_path):
+            raise RuntimeError(f"A kanjiconv daemon is already listening on {socket_path}")
+        os.unlink(socket_path)  # Stale socket left by a daemon that did not shut down cleanly.
+
+    server = _ConversionServer(socket_path, sudachi_dict_type)
+    try:
+        if preload:
+            server.get_converter(dict(_DEFAULT_SETTINGS, dict_type=sudachi_dict_type)).tokenizer
+        logger.info("kanjiconv daemon listening on %s", socket_path)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+class DaemonClient:
+    """Connection to a running conversion daemon."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def convert(self, texts: list, mode: str = "roman", **settings) -> list:
+        """
+        Convert texts with the daemon.
+
+        Args:
+            texts (list): Texts to convert.
+            mode (str): One of "hiragana", "katakana" or "roman".
+            **settings: Any of dict_type, separator, split_mode, use_unidic and use_custom_readings.
+
+        Returns:
+            list: Converted texts, in input order.
+        """
+        request = {"mode": mode, "texts": list(texts), **settings}
+        self._sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("kanjiconv daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["results"]
+
+    def close(self) -> None:
+        self._reader.close()
+        self._sock.close()
+
+    def __enter__(self) -> DaemonClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def connect(socket_path: str | None = None, timeout: float | None = None) -> DaemonClient | None:
+    """
+    Connect to the daemon if one is running.
+
+    Sockets that another user could have created or can connect to are ignored.
+
+    Returns:
+        DaemonClient | None: A client, or None if no trusted daemon is listening on the socket.
+    """
+    socket_path = socket_path or default_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not os.path.lexists(socket_path):
+        return None
+    if not _is_trusted_socket(socket_path):
+        logger.warning("Ignoring %s: it is not a private socket owned by this user", socket_path)
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return DaemonClient(sock)
+
+
+class DaemonConverter:
+    """Converter with the same to_* and convert_many interface as KanjiConv, backed by the daemon."""
+
+    def __init__(self, client: DaemonClient, **settings) -> None:
+        self._client = client
+        self._settings = settings
+
+    def _convert(self, text: str, mode: str) -> str:
+        return self._client.convert([text], mode, **self._settings)[0]
+
+    def to_hiragana(self, text: str) -> str:
+        return self._convert(text, "hiragana")
+
+    def to_katakana(self, text: str) -> str:
+        return self._convert(text, "katakana")
+
+    def to_roman(self, text: str) -> str:
+        return self._convert(text, "roman")
+
+    def convert_many(self, texts, modes=_MODES, workers=None, chunksize: int = 256):
+        """Convert texts in batches of chunksize per request; workers is ignored, the daemon does the work."""
+        texts = iter(texts)
+        while True:
+            chunk = list(itertools.islice(texts, chunksize))
+            if not chunk:
+                return
+            columns = {mode: self._client.convert(chunk, mode, **self._settings) for mode in modes}
+            for i in range(len(chunk)):
+                yield {mode: results[i] for mode, results in columns.items()}
@@ -0,0 +1,114 @@
+"""Precomputed conversion snapshots, a tokenizer-free lookup tier for inputs known in advance.
+
+``build_snapshot`` converts a corpus of texts (brand names, station names, ...) once and stores
+each text's joined readings in a sorted string table, the table format of ``readings_index``.
+``KanjiConv(snapshot=...)`` memory-maps the file and answers those texts without Sudachi.
+
+The header records the settings of the converter that built the snapshot: dictionary type,
+split mode, separator, UniDic, and digests of the custom readings and user dictionaries. A
+converter whose settings differ rejects the snapshot, so stale readings are never served.
+
+File layout (little-endian)::
+
+    magic "KCSNAP\\0\\1"
+    header size (uint32), header (UTF-8 JSON settings fingerprint)
+    one readings_index table: text -> readings joined with the separator
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from functools import lru_cache
+from typing import Iterable
+
+from .readings_index import _OFFSET, _encode_table, _file_key, _MappedTable
+
+__all__ = ["Snapshot", "build_snapshot", "load_snapshot"]
+
+_MAGIC = b"KCSNAP\x00\x01"
+
+
+def build_snapshot(texts: Iterable[str], output: str | os.PathLike, kanji_conv=None) -> int:
+    """
+    Convert texts once and write their readings to a snapshot file.
+
+    Args:
+        texts (Iterable[str]): The corpus; duplicates are stored once.
+        output (str | os.PathLike): Path of the snapshot file to write.
+        kanji_conv (KanjiConv | None): Converter whose settings the snapshot is built with and
+            tied to. Defaults to the shared ``KanjiConv.get()``.
+
+    Returns:
+        int: Number of distinct texts stored.
+    """
+    if kanji_conv is None:
+        from .kanjiconv import KanjiConv
+
+        kanji_conv = KanjiConv.get()
+
+    entries = {}
+    for text in texts:
+        if text not in entries:
+            entries[text] = kanji_conv._joined_readings(text)
+
+    header = json.dumps(kanji_conv._snapshot_fingerprint(), sort_keys=True).encode("utf-8")
+    payload = _MAGIC + _OFFSET.pack(len(header)) + header + _encode_table(entries, False)
+    # Write to a temporary file and rename, so processes never map a half-written snapshot.
+    temporary = f"{os.fspath(output)}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(payload)
+    os.replace(temporary, output)
+    return len(entries)
+
+
+class Snapshot:
+    """A snapshot file, memory-mapped read-only."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = os.path.abspath(os.fspath(path))
+        with open(self.path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[: len(_MAGIC)] != _MAGIC:
+            self._buffer.close()
+            raise ValueError(f"{self.path} is not a kanjiconv snapshot")
+
+        offset = len(_MAGIC)
+        (header_size,) = _OFFSET.unpack_from(self._buffer, offset)
+        offset += _OFFSET.size
+        self.fingerprint = json.loads(self._buffer[offset : offset + header_size].decode("utf-8"))
+        self._table = _MappedTable(self.path, "snapshot", self._buffer, offset + header_size, multi_valued=False)
+
+    def get(self, text: str, default=None):
+        """Joined readings of text, or default if the snapshot does not contain it."""
+        return self._table.get(text, default)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the mapped file in bytes."""
+        return len(self._buffer)
+
+
+# Keyed like the readings index cache, so a rebuilt snapshot is mapped again.
+@lru_cache(maxsize=64)
+def _load_snapshot(path: str, mtime_ns: int, inode: int) -> Snapshot:
+    return Snapshot(path)
+
+
+def load_snapshot(path: str | os.PathLike) -> Snapshot:
+    """
+    Open a snapshot, sharing one mapping per file within the process.
+
+    A file rewritten by build_snapshot is mapped again, so the new readings are seen.
+
+    Args:
+        path (str | os.PathLike): Path written by build_snapshot.
+
+    Returns:
+        Snapshot: The snapshot.
+    """
+    return _load_snapshot(*_file_key(path))
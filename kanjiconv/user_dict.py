@@ -0,0 +1,187 @@
+"""Sudachi user dictionaries built from ``surface,reading`` CSV files.
+
+Words in a user dictionary are segmented and read by Sudachi itself in the normal
+tokenization pass, instead of being substituted into the text before tokenization.
+Compiled dictionaries are cached on disk under a hash of their sources and the system
+dictionary, so they are only rebuilt when one of those changes.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import importlib.resources
+import mmap
+import os
+import struct
+import tempfile
+import unicodedata
+from pathlib import Path
+
+__all__ = ["build_user_dict", "default_cache_dir"]
+
+# Bump when the generated lexicon changes, so stale cached dictionaries are not reused.
+_FORMAT_VERSION = "1"
+
+# Part of speech of user words: a common noun (名詞,普通名詞,一般).
+_NOUN_POS = ("名詞", "普通名詞", "一般", "*", "*", "*")
+
+# System dictionary words whose connection ids user words borrow; the first common noun found is used.
+_NOUN_PROBES = ("机", "猫", "山", "本", "水")
+
+# System dictionary header: version (u64), creation time (u64) and description (256 bytes).
+_HEADER_SIZE = 272
+
+# Word ids carry the dictionary number in their top four bits.
+_WORD_ID_MASK = 0x0FFFFFFF
+
+# Low word cost so user words win over the system dictionary's segmentation.
+_WORD_COST = -10000
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from $KANJICONV_CACHE_DIR, or kanjiconv/user_dict under the user cache dir."""
+    path = os.environ.get("KANJICONV_CACHE_DIR")
+    if path:
+        return Path(path)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "kanjiconv" / "user_dict"
+
+
+def _to_katakana(text: str) -> str:
+    return "".join(chr(ord(char) + 0x60) if "ぁ" <= char <= "ゖ" else char for char in text)
+
+
+def _read_entries(path: str | os.PathLike) -> list:
+    """
+    Read ``surface,reading`` rows from a CSV file.
+
+    Blank lines and lines starting with "#" are ignored. Readings may be hiragana or katakana.
+
+    Returns:
+        list: ``(surface, katakana_reading)`` tuples, in file order.
+    """
+    entries = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for line_number, row in enumerate(csv.reader(f), 1):
+            if not row or not "".join(row).strip() or row[0].startswith("#"):
+                continue
+            if len(row) < 2 or not row[0] or not row[1]:
+                raise ValueError(f"{path}:{line_number}: expected surface,reading")
+            entries.append((row[0], _to_katakana(row[1])))
+    return entries
+
+
+def _system_dictionary_path(dict_type: str) -> Path:
+    """Path of the system dictionary ``sudachipy.Dictionary(dict=dict_type)`` loads: a file or a SudachiDict package."""
+    if Path(dict_type).is_file():
+        return Path(dict_type)
+    package = f"sudachidict_{dict_type}"
+    try:
+        resources = importlib.resources.files(package)
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(f"{package} is not installed. Install it with: pip install {package}") from None
+    return Path(str(resources / "resources" / "system.dic"))
+
+
+def _skip_string(buffer, offset: int) -> int:
+    # Grammar strings are a UTF-16 length (one byte, or two with the high bit set) and UTF-16LE code units.
+    length = buffer[offset]
+    offset += 1
+    if length & 0x80:
+        length = (length & 0x7F) << 8 | buffer[offset]
+        offset += 1
+    return offset + 2 * length
+
+
+def _word_connection_ids(system: Path, word_id: int) -> tuple:
+    """
+    Read the left and right connection ids of a system dictionary word from its word parameter table.
+
+    Returns:
+        tuple: ``(left_id, right_id)``, checked against the size of the connection matrix.
+    """
+    with open(system, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        (pos_count,) = struct.unpack_from("<H", buffer, _HEADER_SIZE)
+        offset = _HEADER_SIZE + 2
+        for _ in range(pos_count * 6):
+            offset = _skip_string(buffer, offset)
+        left_size, right_size = struct.unpack_from("<hh", buffer, offset)
+        offset += 4 + 2 * left_size * right_size
+        (trie_size,) = struct.unpack_from("<I", buffer, offset)
+        offset += 4 + 4 * trie_size
+        (word_id_table_size,) = struct.unpack_from("<I", buffer, offset)
+        offset += 4 + word_id_table_size
+        (word_count,) = struct.unpack_from("<I", buffer, offset)
+        if not 0 <= word_id < word_count:
+            raise ValueError(f"{system}: word id {word_id} is outside the lexicon ({word_count} words)")
+        left_id, right_id, _cost = struct.unpack_from("<hhh", buffer, offset + 4 + 6 * word_id)
+    if not (0 <= left_id < left_size and 0 <= right_id < right_size):
+        raise ValueError(f"{system}: connection ids ({left_id}, {right_id}) are outside the connection matrix")
+    return left_id, right_id
+
+
+def _noun_connection_ids(system: Path) -> tuple:
+    """Connection ids of a common noun in the system dictionary, for user words to share."""
+    import sudachipy
+
+    tokenizer = sudachipy.Dictionary(dict=str(system)).create()
+    for probe in _NOUN_PROBES:
+        for morpheme in tokenizer.tokenize(probe):
+            if tuple(morpheme.part_of_speech()) == _NOUN_POS and morpheme.dictionary_id() == 0:
+                return _word_connection_ids(system, morpheme.word_id() & _WORD_ID_MASK)
+    raise ValueError(f"{system}: no common noun ({','.join(_NOUN_POS[:3])}) found to take connection ids from")
+
+
+def _lexicon_rows(entries: list, connection_ids: tuple) -> list:
+    rows = []
+    for surface, reading in entries:
+        # Sudachi matches the normalized input text, so the trie key must be normalized the same way.
+        headword = unicodedata.normalize("NFKC", surface).lower()
+        connection = (*connection_ids, _WORD_COST)
+        rows.append((headword, *connection, surface, *_NOUN_POS, reading, surface, "*", "A", "*", "*", "*"))
+    return rows
+
+
+def build_user_dict(
+    sources: list,
+    sudachi_dict_type: str = "full",
+    cache_dir: str | os.PathLike | None = None,
+) -> str:
+    """
+    Compile CSV sources into one Sudachi user dictionary, reusing a cached build when nothing changed.
+
+    Args:
+        sources (list): Paths of ``surface,reading`` CSV files.
+        sudachi_dict_type (str): System dictionary the user dictionary is built against.
+        cache_dir (str | os.PathLike | None): Where compiled dictionaries are kept.
+            Defaults to default_cache_dir().
+
+    Returns:
+        str: Absolute path of the compiled ``.dic`` file.
+    """
+    from sudachipy import sudachipy as _sudachi  # The compiled module; build_user_dic is not re-exported.
+
+    system = _system_dictionary_path(sudachi_dict_type)
+    entries = [entry for source in sources for entry in _read_entries(source)]
+
+    digest = hashlib.sha256()
+    digest.update(f"{_FORMAT_VERSION}\0{system}\0{system.stat().st_size}\0".encode("utf-8"))
+    for surface, reading in entries:
+        digest.update(f"{surface}\t{reading}\n".encode("utf-8"))
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    output = cache_dir / f"{digest.hexdigest()}.dic"
+    if output.exists():
+        return str(output.resolve())
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=cache_dir) as workdir:
+        lexicon = Path(workdir) / "lex.csv"
+        with open(lexicon, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f, lineterminator="\n").writerows(_lexicon_rows(entries, _noun_connection_ids(system)))
+        built = Path(workdir) / output.name
+        _sudachi.build_user_dic(system=system, lex=[lexicon], output=built, description="kanjiconv user dictionary")
+        # Publish atomically, so concurrent builders never load a partially written dictionary.
+        os.replace(built, output)
+    return str(output.resolve())
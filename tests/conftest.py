@@ -5,8 +5,10 @@ unit tests can run without downloading large external dictionaries.
 """
 from __future__ import annotations
 
+import importlib.util
 import sys
 import types
+from unittest.mock import patch
 
 import pytest
 
@@ -32,9 +34,32 @@ class _StubSudachiDictionary:  # pragma: no cover - simple holder
         )
 
 
+class _StubSudachiConfig:  # pragma: no cover - simple holder
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+def _stub_unpatched(*args, **kwargs):  # pragma: no cover - patched in tests
+    raise RuntimeError("sudachipy stub used without patching; tests should patch this function.")
+
+
+# The compiled extension module, where the dictionary builders live.
+_sudachipy_native_stub = types.ModuleType("sudachipy.sudachipy")
+_sudachipy_native_stub.build_system_dic = _stub_unpatched
+_sudachipy_native_stub.build_user_dic = _stub_unpatched
+
+# Config lives in sudachipy.config; sudachipy 0.6.8 does not re-export it at the top level.
+_sudachipy_config_stub = types.ModuleType("sudachipy.config")
+_sudachipy_config_stub.Config = _StubSudachiConfig
+
 _sudachipy_stub.Dictionary = _StubSudachiDictionary
 _sudachipy_stub.SplitMode = types.SimpleNamespace(A="A", B="B", C="C")
+_sudachipy_stub.sudachipy = _sudachipy_native_stub
+_sudachipy_stub.config = _sudachipy_config_stub
 _install_stub("sudachipy", _sudachipy_stub)
+_install_stub("sudachipy.sudachipy", _sudachipy_native_stub)
+_install_stub("sudachipy.config", _sudachipy_config_stub)
 
 
 # Stub for fugashi ---------------------------------------------------------
@@ -60,11 +85,63 @@ _unidic_stub.DICDIR = "/usr/share/unidic"
 _install_stub("unidic", _unidic_stub)
 
 
+# For behaviour only the real tokenizer shows (such as segmentation at a start of text), which the
+# stubs and mocks cannot reproduce.
+requires_sudachi_dictionary = pytest.mark.skipif(
+    importlib.util.find_spec("sudachidict_full") is None, reason="needs sudachipy and sudachidict_full installed"
+)
+
+
+class MockToken:
+    """Stand-in for a Sudachi morpheme with a fixed reading and surface."""
+
+    def __init__(self, reading, surface=None):
+        self._reading = reading
+        self._surface = surface if surface is not None else reading
+
+    def reading_form(self):
+        return self._reading
+
+    def surface(self):
+        return self._surface
+
+
+@pytest.fixture
+def readings():
+    """Katakana readings ``mock_tokenizer`` gives whole texts; override it in a test module."""
+    return {}
+
+
+@pytest.fixture
+def mock_tokenizer(readings):
+    """Patch sudachipy.Dictionary with a tokenizer reading each text as one token from ``readings``.
+
+    Texts without an entry are read as themselves.
+    """
+    with patch("sudachipy.Dictionary") as mock_dictionary:
+        tokenizer = mock_dictionary.return_value.create.return_value
+        tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(readings.get(text, text), text)]
+        yield tokenizer
+
+
 @pytest.fixture(autouse=True)
 def _clear_kanjiconv_caches():
     """Clear module-level caches so per-test mocks/patches don't leak across tests."""
     from kanjiconv import kanjiconv as kanjiconv_module
 
-    kanjiconv_module._get_tokenizer.cache_clear()
+    def clear():
+        kanjiconv_module._get_dictionary.cache_clear()
+        kanjiconv_module._tokenizers.clear()
+        kanjiconv_module._unidic_taggers.clear()
+        kanjiconv_module._get_shared_unidic_memo.cache_clear()
+        kanjiconv_module.KanjiConv.pool_clear()
+
+    clear()
     yield
-    kanjiconv_module._get_tokenizer.cache_clear()
+    clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_daemon_socket(monkeypatch, tmp_path):
+    """Point the CLI at a socket that does not exist, so a locally running daemon is never used."""
+    monkeypatch.setenv("KANJICONV_SOCKET", str(tmp_path / "kanjiconv.sock"))
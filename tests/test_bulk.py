@@ -0,0 +1,56 @@
+import csv
+
+import pytest
+
+from kanjiconv.bulk import convert_column, convert_file
+from kanjiconv.kanjiconv import KanjiConv
+
+
+@pytest.fixture
+def readings():
+    return {"東京": "トウキョウ", "大阪": "オオサカ"}
+
+
+def test_convert_column_converts_each_distinct_value_once(mock_tokenizer):
+    kanji_conv = KanjiConv(separator="")
+
+    result = convert_column(["東京", "大阪", None, "東京", float("nan"), "東京"], "hiragana", kanji_conv)
+
+    assert result == ["とうきょう", "おおさか", None, "とうきょう", None, "とうきょう"]
+    assert [call.args[0] for call in mock_tokenizer.tokenize.call_args_list] == ["東京", "大阪"]
+
+
+def test_convert_column_pandas_and_arrow(mock_tokenizer):
+    pandas = pytest.importorskip("pandas")
+    pyarrow = pytest.importorskip("pyarrow")
+    kanji_conv = KanjiConv(separator="")
+
+    series = pandas.Series(["東京", None, "大阪", "東京"], index=[10, 11, 12, 13], name="city")
+    result = convert_column(series, "roman", kanji_conv)
+    assert result.tolist() == ["toukyou", None, "oosaka", "toukyou"]
+    assert result.index.tolist() == [10, 11, 12, 13] and result.name == "city"
+    categorical = pandas.Categorical(["東京", None, "大阪", "東京"])
+    assert convert_column(categorical, "roman", kanji_conv).tolist() == ["toukyou", None, "oosaka", "toukyou"]
+    assert convert_column(series.astype("category"), "roman", kanji_conv).name == "city"
+
+    chunked = pyarrow.chunked_array([["東京", None], ["大阪", "東京"]])
+    assert convert_column(chunked, "roman", kanji_conv).to_pylist() == ["toukyou", None, "oosaka", "toukyou"]
+
+
+def test_convert_file_csv_in_batches(mock_tokenizer, tmp_path):
+    source = tmp_path / "cities.csv"
+    output = tmp_path / "out.csv"
+    source.write_text("id,city\n1,東京\n2,大阪\n3,東京\n", encoding="utf-8")
+
+    rows = convert_file(source, "city", output, mode="katakana", kanji_conv=KanjiConv(separator=""), batch_size=2)
+
+    assert rows == 3
+    with open(output, newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == [
+            ["id", "city", "city_katakana"],
+            ["1", "東京", "トウキョウ"],
+            ["2", "大阪", "オオサカ"],
+            ["3", "東京", "トウキョウ"],
+        ]
+    with pytest.raises(ValueError, match="'town'"):
+        convert_file(source, "town", output, kanji_conv=KanjiConv())
@@ -64,3 +64,70 @@ def test_main_use_unidic_without_extra_exits_with_hint(mock_kanji_conv):
 
     assert result == 1
     assert "kanjiconv[unidic]" in stderr.getvalue()
+
+
+@patch("kanjiconv.cli.KanjiConv")
+def test_main_streams_stdin_lines_with_one_converter(mock_kanji_conv):
+    mock_instance = mock_kanji_conv.return_value
+    mock_instance.convert_many.side_effect = lambda texts, modes, workers: (
+        {"katakana": text.upper()} for text in texts
+    )
+
+    stdin = io.StringIO("abc\n\r\ndef\n")
+    stdout = io.StringIO()
+    with patch.object(sys, "stdin", stdin), patch.object(sys, "stdout", stdout):
+        result = main(["-m", "katakana", "--jobs", "2"])
+
+    assert result == 0
+    assert stdout.getvalue() == "ABC\n\nDEF\n"
+    mock_kanji_conv.assert_called_once()
+    assert mock_instance.convert_many.call_args.kwargs["workers"] == 2
+
+
+@patch("kanjiconv.cli.KanjiConv")
+def test_main_converts_input_file_to_output_file(mock_kanji_conv, tmp_path):
+    mock_instance = mock_kanji_conv.return_value
+    mock_instance.convert_many.side_effect = lambda texts, modes, workers: (
+        {"roman": f"<{text}>"} for text in texts
+    )
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.txt"
+    input_path.write_text("最高\n漫画\n", encoding="utf-8")
+
+    result = main(["--input", str(input_path), "--output", str(output_path)])
+
+    assert result == 0
+    assert output_path.read_text(encoding="utf-8") == "<最高>\n<漫画>\n"
+    assert mock_instance.convert_many.call_args.kwargs["workers"] is None
+
+
+@patch("kanjiconv.cli.KanjiConv")
+def test_main_convert_column_writes_converted_csv(mock_kanji_conv, tmp_path):
+    mock_instance = mock_kanji_conv.return_value
+    mock_instance.convert_many.side_effect = lambda texts, modes: ({"roman": f"<{text}>"} for text in texts)
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    input_path.write_text("name\n最高\n漫画\n最高\n", encoding="utf-8")
+
+    result = main(["convert-column", str(input_path), "-c", "name", "-o", str(output_path), "--output-column", "yomi"])
+
+    assert result == 0
+    assert output_path.read_text(encoding="utf-8").splitlines() == ["name,yomi", "最高,<最高>", "漫画,<漫画>", "最高,<最高>"]
+    assert mock_kanji_conv.call_args.kwargs["cache_size"] == 65536
+
+
+@patch("kanjiconv.snapshot.build_snapshot")
+@patch("kanjiconv.cli.KanjiConv")
+def test_main_build_snapshot_skips_blank_lines(mock_kanji_conv, mock_build_snapshot, tmp_path):
+    built = []
+    mock_build_snapshot.side_effect = lambda texts, output, converter: built.extend(texts)
+    corpus_path = tmp_path / "stations.txt"
+    corpus_path.write_text("東京\n\n新宿\r\n", encoding="utf-8")
+
+    result = main(["build-snapshot", str(corpus_path), "-o", str(tmp_path / "stations.snap"), "-s", ""])
+
+    assert result == 0
+    assert mock_kanji_conv.call_args.kwargs["separator"] == ""
+    assert built == ["東京", "新宿"]
+    _, output, converter = mock_build_snapshot.call_args.args
+    assert output == str(tmp_path / "stations.snap") and converter is mock_kanji_conv.return_value
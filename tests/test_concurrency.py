@@ -0,0 +1,47 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from kanjiconv.kanjiconv import KanjiConv
+
+from .conftest import MockToken
+
+
+class SingleThreadTokenizer:
+    """Tokenizer that fails if it is ever used by two threads, like a non-thread-safe native tokenizer."""
+
+    def __init__(self):
+        self.owner = None
+
+    def tokenize(self, text, mode):
+        if self.owner is None:
+            self.owner = threading.get_ident()
+        assert self.owner == threading.get_ident(), "tokenizer shared between threads"
+        return [MockToken(char) for char in text]
+
+
+@patch("sudachipy.Dictionary")
+def test_concurrent_conversions_use_per_thread_tokenizers(mock_dictionary):
+    tokenizers = []
+
+    def create():
+        tokenizers.append(SingleThreadTokenizer())
+        return tokenizers[-1]
+
+    mock_dictionary.return_value.create.side_effect = create
+    # Without the kana fast path, so every text reaches the tokenizers.
+    kanji_conv = KanjiConv(separator="", kana_fast_path=False)
+    texts = [f"キョウハ{'ア' * (i % 7)}ハレ。" for i in range(400)]
+    expected = [f"kyouha{'a' * (i % 7)}hare. " for i in range(400)]
+    start = threading.Barrier(8)
+
+    def convert(chunk):
+        start.wait()
+        return [kanji_conv.to_roman(text) for text in chunk]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(convert, [texts[i::8] for i in range(8)]))
+
+    assert results == [expected[i::8] for i in range(8)]
+    assert mock_dictionary.call_count == 1  # One shared dictionary...
+    assert len(tokenizers) == 8  # ...and one tokenizer per thread.
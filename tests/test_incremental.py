@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from kanjiconv.incremental import IncrementalConverter
+from kanjiconv.kanjiconv import KanjiConv
+
+from .conftest import MockToken
+
+
+@pytest.fixture
+def char_tokenizer(mock_tokenizer):
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(char) for char in text]
+    return mock_tokenizer
+
+
+@pytest.mark.parametrize("separator", ["", "/"])
+def test_edits_match_full_conversion(char_tokenizer, separator):
+    kanji_conv = KanjiConv(separator=separator, kana_fast_path=False)
+    incremental = IncrementalConverter(kanji_conv, mode="roman", text="キョウハハレ。アシタハアメ。")
+
+    edits = [
+        (0, 0, "ア"),  # Insert at the start.
+        (7, 8, "ー"),  # Replace a sentence end, merging two sentences.
+        (7, 8, "。"),  # And split them again.
+        (8, 8, "カ"),  # Insert right after a boundary.
+        (3, 10, ""),  # Delete across sentences.
+        (len("アキョウタハアメ。"), len("アキョウタハアメ。"), "オワリ"),  # Append.
+    ]
+    for start, end, replacement in edits:
+        text = incremental.text[:start] + replacement + incremental.text[end:]
+        assert incremental.edit(start, end, replacement) == kanji_conv.to_roman(text)
+        assert incremental.text == text
+        assert [token.start for token in incremental.tokens] == [token.start for token in kanji_conv.tokenize(text)]
+
+
+@pytest.mark.parametrize("separator", ["", " "])
+def test_random_edits_match_full_conversion_with_start_of_text_effects(mock_tokenizer, separator):
+    def tokenize(text, mode):
+        # Like Sudachi, read the start of a text differently from the same characters after a sentence end.
+        tokens = [MockToken(char) for char in text]
+        if tokens and text[0] not in "。！\n":
+            tokens[0] = MockToken("ヌ", text[0])
+        return tokens
+
+    mock_tokenizer.tokenize.side_effect = tokenize
+    kanji_conv = KanjiConv(separator=separator, kana_fast_path=False)
+    incremental = IncrementalConverter(kanji_conv, mode="katakana", text="アイ。ウエ！\nオカ。")
+    rng = random.Random(0)
+    for _ in range(300):
+        text = incremental.text
+        start = rng.randint(0, len(text))
+        end = rng.randint(start, min(len(text), start + 4))
+        replacement = "".join(rng.choice("アイウ。！\n") for _ in range(rng.randint(0, 3)))
+        expected = kanji_conv.to_katakana(text[:start] + replacement + text[end:])
+        assert incremental.edit(start, end, replacement) == expected
+
+
+def test_edit_only_retokenizes_touched_sentences(char_tokenizer):
+    kanji_conv = KanjiConv(separator="")
+    incremental = IncrementalConverter(kanji_conv, mode="hiragana", text="アイ。" * 100)
+
+    char_tokenizer.tokenize.reset_mock()
+    assert incremental.set_text("アイ。" * 50 + "アウ。" + "アイ。" * 49) == "あい。" * 50 + "あう。" + "あい。" * 49
+    # The edited sentence and the neighbour it touches, not the whole text.
+    assert sum(len(call.args[0]) for call in char_tokenizer.tokenize.call_args_list) <= 6
+
+
+def test_invalid_edits(char_tokenizer):
+    with pytest.raises(ValueError):
+        IncrementalConverter(KanjiConv(), mode="kanji")
+    incremental = IncrementalConverter(KanjiConv(), text="アイ")
+    with pytest.raises(ValueError):
+        incremental.edit(1, 3, "ウ")
+    assert incremental.set_text("") == ""
+    assert incremental.tokens == []
@@ -1,21 +1,40 @@
+import asyncio
+import json
+import pickle
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
-from kanjiconv.entities import SudachiDictType
-from kanjiconv.kanjiconv import KanjiConv
+from kanjiconv.entities import SudachiDictType, Token, TokenSource
+from kanjiconv.kanjiconv import KanjiConv, _get_romaji_transducer
 
+from .conftest import MockToken, requires_sudachi_dictionary
 
-class MockToken:
-    def __init__(self, reading, surface=None):
-        self._reading = reading
-        self._surface = surface if surface is not None else reading
 
-    def reading_form(self):
-        return self._reading
+class MockUnidicNode:
+    def __init__(self, surface, kana, white_space=""):
+        self.surface = surface
+        self.white_space = white_space
+        self.feature = type("Feature", (), {"kana": kana})()
 
-    def surface(self):
-        return self._surface
+
+def space_separated_tagger(kana_by_word):
+    """Mock fugashi tagger: one node per kana of each space-separated word, None for unknown words."""
+
+    def tag(text):
+        nodes = []
+        for index, word in enumerate(text.split(" ")):
+            kana = kana_by_word.get(word, [None])
+            size = len(word) // len(kana)
+            for part, reading in enumerate(kana):
+                surface = word[part * size :] if part == len(kana) - 1 else word[part * size : (part + 1) * size]
+                nodes.append(MockUnidicNode(surface, reading, " " if index and not part else ""))
+        return nodes
+
+    return tag
 
 
 @patch("os.path.isfile", return_value=True)
@@ -80,6 +99,50 @@ def test_to_roman(mock_dictionary, mock_isfile):
     assert result == "yuuyuuhakusho/ha/, /saikou/no/manga/desu/. "
 
 
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_to_roman_handles_sokuon_and_long_vowels(mock_dictionary, mock_isfile):
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [
+        MockToken("ガッコウ", "学校"),
+        MockToken("キャッチャー"),
+        MockToken("コーヒー"),
+        MockToken("マッチ"),
+        MockToken("ABC"),
+        MockToken("ッ"),
+    ]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="/")
+    result = kanji_conv.to_roman("学校キャッチャーコーヒーマッチABCッ")
+    assert result == "gakkou/kyatchaa/koohii/matchi/ABC/"
+
+
+def test_romaji_table_does_not_remember_long_vowel_runs():
+    transducer = _get_romaji_transducer()
+    size = len(transducer._table)
+    for length in range(10, 20):
+        assert transducer("ス" + "ー" * length) == "s" + "u" * (length + 1)
+    assert len(transducer._table) == size
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_converters_return_token_lists(mock_dictionary, mock_isfile):
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [
+        MockToken("ヴァイオリン"),
+        MockToken("サンヵゲツ", "三ヵ月"),
+        MockToken("ケ", "ヶ"),
+        MockToken("ヽ"),
+    ]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="/")
+    assert kanji_conv.to_hiragana("ヴァイオリン三ヵ月ヶヽ") == "ゔぁいおりん/さんゕげつ/け/ゝ"
+    assert kanji_conv.to_hiragana("ヴァイオリン三ヵ月ヶヽ", as_list=True) == ["ゔぁいおりん", "さんゕげつ", "け", "ゝ"]
+    assert kanji_conv.to_katakana("ヴァイオリン三ヵ月ヶヽ", as_list=True) == ["ヴァイオリン", "サンヵゲツ", "ケ", "ヽ"]
+    assert kanji_conv.to_roman("三ヵ月", as_list=True)[2] == "ke"
+
+
 @patch("os.path.isfile", return_value=True)
 @patch("sudachipy.Dictionary")
 def test_custom_kanji_readings(mock_dictionary, mock_isfile):
@@ -161,6 +224,166 @@ def test_with_unidic(mock_unidic_find, mock_fugashi_tagger, mock_dictionary, moc
     assert result == "geki"
 
 
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+@patch("fugashi.Tagger")
+@patch("kanjiconv.kanjiconv.UNIDIC_AVAILABLE", True)
+def test_unidic_lookups_are_memoized(mock_fugashi_tagger, mock_dictionary, mock_isfile):
+    """Repeated unknown surfaces should hit the UniDic memo instead of calling the tagger again."""
+    mock_tagger_instance = mock_fugashi_tagger.return_value
+    mock_tagger_instance.side_effect = space_separated_tagger({"激": ["ゲキ"]})
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [MockToken("", "激"), MockToken("", "檄"), MockToken("", "激")]
+
+    kanji_conv = KanjiConv(
+        sudachi_dict_type=SudachiDictType.FULL.value,
+        separator="/",
+        use_custom_readings=False,
+        use_unidic=True,
+        share_unidic_cache=True,
+    )
+    assert kanji_conv.to_katakana("激檄激") == "ゲキ/檄/ゲキ"
+    assert kanji_conv.to_katakana("激檄激") == "ゲキ/檄/ゲキ"
+
+    # Both unknown surfaces are looked up in one tagger call, and only on the first conversion.
+    assert mock_tagger_instance.call_count == 1
+    unidic_stats = kanji_conv.stats()["unidic_cache"]
+    assert (unidic_stats["hits"], unidic_stats["misses"], unidic_stats["currsize"]) == (2, 2, 2)
+    assert unidic_stats["hit_rate"] == pytest.approx(2 / 4)
+
+    # Instances opting into sharing reuse the same memo.
+    other = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, use_unidic=True, share_unidic_cache=True)
+    other.to_katakana("激")
+    assert mock_tagger_instance.call_count == 1
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+@patch("fugashi.Tagger")
+@patch("kanjiconv.kanjiconv.UNIDIC_AVAILABLE", True)
+def test_unidic_fallback_is_batched_per_document(mock_fugashi_tagger, mock_dictionary, mock_isfile):
+    mock_tagger_instance = mock_fugashi_tagger.return_value
+    # "檄文" comes back as two nodes; both must be mapped back to that one token.
+    mock_tagger_instance.side_effect = space_separated_tagger({"激": ["ゲキ"], "檄文": ["ゲキ", "ブン"]})
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [
+        MockToken("", "激"),
+        MockToken("ヲ", "を"),
+        MockToken("", "檄文"),
+        MockToken("", "㐂"),
+        MockToken("", "激"),
+    ]
+
+    kanji_conv = KanjiConv(separator="/", use_custom_readings=False, use_unidic=True, unidic_cache_size=0)
+    assert kanji_conv.to_katakana("激を檄文㐂激") == "ゲキ/ヲ/ゲキブン/㐂/ゲキ"
+    assert mock_tagger_instance.call_count == 1
+    assert mock_tagger_instance.call_args.args == ("激 檄文 㐂",)
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+@patch("fugashi.Tagger")
+@patch("kanjiconv.kanjiconv.UNIDIC_AVAILABLE", True)
+def test_failed_unidic_batch_is_retried_per_surface(mock_fugashi_tagger, mock_dictionary, mock_isfile):
+    tag = space_separated_tagger({"激": ["ゲキ"], "檄文": ["ゲキ", "ブン"]})
+
+    def tagger(text):
+        if "㐂" in text:
+            raise RuntimeError("tagger failure")
+        return tag(text)
+
+    mock_tagger_instance = mock_fugashi_tagger.return_value
+    mock_tagger_instance.side_effect = tagger
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [MockToken("", "激"), MockToken("", "㐂"), MockToken("", "檄文")]
+
+    kanji_conv = KanjiConv(separator="/", use_custom_readings=False, use_unidic=True)
+    assert kanji_conv.to_katakana("激㐂檄文") == "ゲキ/㐂/ゲキブン"
+    # Only the failing surface is memoized without a reading.
+    assert kanji_conv.to_katakana("激㐂檄文") == "ゲキ/㐂/ゲキブン"
+    assert mock_tagger_instance.call_count == 4
+    assert kanji_conv._unidic_memo.get("激") == "ゲキ"
+    assert kanji_conv._unidic_memo.get("㐂") == ""
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_async_conversions_coalesce_duplicate_requests(mock_dictionary, mock_isfile):
+    """Concurrent async requests for the same text should run the conversion once."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(text)]
+
+    kanji_conv = KanjiConv(
+        sudachi_dict_type=SudachiDictType.FULL.value,
+        executor=ThreadPoolExecutor(max_workers=2),
+        max_in_flight=1,
+    )
+
+    async def convert():
+        return await asyncio.gather(
+            kanji_conv.ato_roman("カ"),
+            kanji_conv.ato_roman("カ"),
+            kanji_conv.ato_hiragana("カ"),
+            kanji_conv.ato_katakana("キ"),
+        )
+
+    assert asyncio.run(convert()) == ["ka", "ka", "か", "キ"]
+    assert mock_tokenizer.tokenize.call_count == 3
+    assert kanji_conv._in_flight == {}
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_convert_in_process_reuses_converter_per_payload(mock_dictionary, mock_isfile):
+    """Process executors receive a picklable payload and build each configuration once."""
+    from kanjiconv import kanjiconv as kanjiconv_module
+
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(text)]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="/")
+    kanji_conv.custom_readings["compound"]["カ"] = "キ"
+    payload = kanji_conv._worker_payload()
+    pickle.dumps(payload)
+
+    with patch.object(kanjiconv_module, "_process_converters", kanjiconv_module._LRUCache(8)) as converters:
+        assert kanjiconv_module._convert_in_process(payload, "roman", "カ") == "ki"
+        assert kanjiconv_module._convert_in_process(payload, "hiragana", "カ") == "き"
+        assert converters.info().currsize == 1
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_tokenize_reports_sources_and_original_offsets(mock_dictionary, mock_isfile):
+    """tokenize should expose per-token readings, their source and offsets in the input text."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [
+        MockToken("", "生"),
+        MockToken("ト", "と"),
+        MockToken("ゲキ", "げき"),
+        MockToken("ヲ", "を"),
+        MockToken("トバス", "とばす"),
+        MockToken("", "☆"),
+        MockToken("ホン", "[ホン]"),
+    ]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value)
+    kanji_conv.custom_readings = {"single": {"生": ["セイ"]}, "compound": {"激を飛ばす": "げきをとばす"}}
+    tokens = kanji_conv.tokenize("生と激を飛ばす☆[ホン]")
+
+    assert tokens == [
+        Token("生", "セイ", TokenSource.CUSTOM, 0, 1),
+        Token("と", "ト", TokenSource.SUDACHI, 1, 2),
+        Token("げき", "ゲキ", TokenSource.CUSTOM, 2, 7),
+        Token("を", "ヲ", TokenSource.CUSTOM, 2, 7),
+        Token("とばす", "トバス", TokenSource.CUSTOM, 2, 7),
+        Token("☆", "☆", TokenSource.PASSTHROUGH, 7, 8),
+        Token("[ホン]", "ホン", TokenSource.BRACKET, 8, 12),
+    ]
+    assert str(tokens[0].source) == "custom"
+    assert not hasattr(tokens[0], "__dict__")
+
+
 @patch("kanjiconv.kanjiconv.UNIDIC_AVAILABLE", False)
 def test_use_unidic_without_extra_raises_import_error():
     """use_unidic=True without the optional unidic extra installed should fail loudly."""
@@ -193,5 +416,371 @@ def test_custom_readings_are_not_shared_across_instances(mock_dictionary, mock_i
     assert "__not_a_real_kanji__" not in second.custom_readings["single"]
 
 
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_custom_readings_tables_behave_like_dicts(mock_dictionary, mock_isfile):
+    """The change-tracking tables copy, merge and serialize to plain dicts."""
+    kanji_conv = KanjiConv()
+    kanji_conv.custom_readings = {"single": {"激": ["げき"]}, "compound": {"飛ばす": "とばす"}}
+    compound = kanji_conv.custom_readings["compound"]
+
+    copied = compound.copy()
+    assert copied == {"飛ばす": "とばす"} and type(copied) is dict
+    copied["激を飛ばす"] = "げきをとばす"
+    assert "激を飛ばす" not in compound
+    assert compound | {"東京": "とうきょう"} == {"飛ばす": "とばす", "東京": "とうきょう"}
+    assert {"飛ばす": "ひばす"} | compound == {"飛ばす": "とばす"}
+
+    data = kanji_conv.custom_readings.to_dict()
+    assert json.loads(json.dumps(data)) == {"single": {"激": ["げき"]}, "compound": {"飛ばす": "とばす"}}
+    assert "激" in KanjiConv().custom_readings["single"]  # The bundled tables are not affected.
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_convert_many_tokenizes_each_text_once(mock_dictionary, mock_isfile):
+    """convert_many should produce every requested mode from a single tokenization."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [
+        MockToken("サイコウ", "最高"),
+        MockToken("ノ", "の"),
+        MockToken("マンガ", "漫画"),
+    ]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="/")
+    results = kanji_conv.convert_many(["最高の漫画", "最高の漫画"])
+
+    assert not isinstance(results, list)
+    assert list(results) == [
+        {"hiragana": "さいこう/の/まんが", "katakana": "サイコウ/ノ/マンガ", "roman": "saikou/no/manga"},
+    ] * 2
+    assert mock_tokenizer.tokenize.call_count == 2
+
+    assert list(kanji_conv.convert_many(["最高の漫画"], modes=["roman"])) == [{"roman": "saikou/no/manga"}]
+    with pytest.raises(ValueError):
+        list(kanji_conv.convert_many(["最高の漫画"], modes=["kanji"]))
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_compound_readings_use_longest_match_and_track_mutation(mock_dictionary, mock_isfile):
+    """Compounds are replaced in one longest-match pass, and in-place edits rebuild the index."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = []
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value)
+    kanji_conv.custom_readings = {
+        "single": {},
+        "compound": {"飛ばす": "とばす", "激を飛ばす": "げきをとばす"},
+    }
+
+    kanji_conv.to_katakana("檄と激を飛ばす、飛ばす")
+    assert mock_tokenizer.tokenize.call_args[0][0] == "檄とげきをとばす、とばす"
+
+    kanji_conv.custom_readings["compound"]["檄"] = "げき"
+    kanji_conv.to_katakana("檄と激を飛ばす")
+    assert mock_tokenizer.tokenize.call_args[0][0] == "げきとげきをとばす"
+
+    del kanji_conv.custom_readings["compound"]["激を飛ばす"]
+    kanji_conv.to_katakana("激を飛ばす")
+    assert mock_tokenizer.tokenize.call_args[0][0] == "激をとばす"
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+@patch("concurrent.futures.ProcessPoolExecutor", ThreadPoolExecutor)
+def test_convert_many_with_workers_preserves_input_order(mock_dictionary, mock_isfile):
+    """Parallel conversion should chunk the input across workers and yield results in order."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(text)]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="/")
+    kanji_conv.custom_readings["compound"]["ア"] = "カ"
+    texts = ["ア", "イ", "ウ", "エ", "オ"] * 5
+
+    results = list(kanji_conv.convert_many(texts, modes=["katakana"], workers=3, chunksize=2))
+
+    expected = [text.replace("ア", "カ") for text in texts]
+    assert [result["katakana"] for result in results] == expected
+    with pytest.raises(ValueError):
+        list(kanji_conv.convert_many(texts, workers=0))
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_result_cache_hits_evicts_and_invalidates(mock_dictionary, mock_isfile):
+    """The opt-in LRU cache should skip tokenization on repeats and respect custom reading edits."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(text)]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, cache_size=2)
+    assert kanji_conv.to_roman("カ") == "ka"
+    assert kanji_conv.to_roman("カ") == "ka"
+    assert mock_tokenizer.tokenize.call_count == 1
+    assert kanji_conv.cache_info() == (1, 1, 2, 1)
+
+    # Different modes and separators are cached separately.
+    assert kanji_conv.to_hiragana("カ") == "か"
+    kanji_conv.to_hiragana("キ")
+    assert kanji_conv.cache_info().currsize == 2
+    assert mock_tokenizer.tokenize.call_count == 3
+
+    # Least recently used entry ("カ" as roman) was evicted.
+    kanji_conv.to_roman("カ")
+    assert mock_tokenizer.tokenize.call_count == 4
+
+    kanji_conv.custom_readings["compound"]["カ"] = "キ"
+    assert kanji_conv.to_roman("カ") == "ki"
+
+    kanji_conv.cache_clear()
+    assert kanji_conv.cache_info() == (0, 0, 2, 0)
+    assert KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value).cache_info() == (0, 0, 0, 0)
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_instrumentation_reports_stages_and_sources(mock_dictionary, mock_isfile):
+    """Opt-in instrumentation accumulates stage timings and source counts and feeds the callback."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [MockToken("サイコウ", "最高"), MockToken("", "檄")]
+
+    events = []
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, stats_callback=events.append)
+    kanji_conv.custom_readings = {"single": {"檄": ["ゲキ"]}, "compound": {}}
+    assert kanji_conv.to_roman("最高檄") == "saikou geki"
+    kanji_conv.to_hiragana("最高檄", as_list=True)
+
+    stats = kanji_conv.stats()
+    assert set(stats["stages"]) == {"compound", "tokenize", "unidic", "custom", "roman", "hiragana"}
+    assert stats["stages"]["tokenize"]["calls"] == 2
+    assert stats["stages"]["roman"]["calls"] == 1
+    assert stats["tokens"] == 4
+    assert stats["sources"] == {"sudachi": 2, "custom": 2}
+    assert [event["tokens"] for event in events] == [2, 0, 2, 0]
+    assert events[0]["sources"] == {"sudachi": 1, "custom": 1}
+
+    kanji_conv.stats_clear()
+    assert kanji_conv.stats()["tokens"] == 0
+    assert "stages" not in KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value).stats()
+
+
+@pytest.mark.parametrize("separator", [" ", ""])
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_convert_stream_matches_whole_document(mock_dictionary, mock_isfile, separator):
+    """Chunked conversion yields the same output as converting the whole document at once."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(char) for char in text]
+
+    kanji_conv = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator=separator)
+    document = "キョウハ、ハレ。\nアシタハ、アメ！「ホント？」ソウ。ラーメン、ラーメン。" * 20
+    for mode in ("hiragana", "katakana", "roman"):
+        expected = getattr(kanji_conv, f"to_{mode}")(document)
+        assert "".join(kanji_conv.convert_stream(document, mode, chunk_size=16)) == expected
+
+    pieces = [document[i : i + 7] for i in range(0, len(document), 7)]
+    expected = kanji_conv.to_roman(document)
+    mock_tokenizer.tokenize.reset_mock()
+    assert "".join(kanji_conv.convert_stream(pieces, "roman", chunk_size=16)) == expected
+    assert max(len(call.args[0]) for call in mock_tokenizer.tokenize.call_args_list) <= 16
+    with pytest.raises(ValueError):
+        list(kanji_conv.convert_stream(document, chunk_size=0))
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_convert_stream_tokenizes_chunks_after_the_preceding_break(mock_dictionary, mock_isfile):
+    """Each chunk is tokenized after the break ending the previous chunk, not at a start of text."""
+
+    def tokenize(text, mode):
+        # Like Sudachi, read the start of a text differently from the same characters after a break.
+        tokens = [MockToken(char) for char in text]
+        if tokens and text[0] not in "。、\n":
+            tokens[0] = MockToken("ヌ", text[0])
+        return tokens
+
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = tokenize
+    kanji_conv = KanjiConv(separator="/")
+    document = "カキクケコ。\nサシスセソ、タチツテト。" * 10
+    expected = kanji_conv.to_roman(document)
+    assert expected.startswith("nu/ki/")
+    assert "".join(kanji_conv.convert_stream(document, "roman", chunk_size=12)) == expected
+    assert mock_tokenizer.tokenize.call_args_list[-1].args[0].startswith("。")
+
+
+@requires_sudachi_dictionary
+def test_convert_stream_matches_whole_document_with_sudachi():
+    """With the real dictionary, chunk boundaries do not change Sudachi's segmentation."""
+    kanji_conv = KanjiConv(separator=" ")
+    for document in ("ど行く。かとんと見当がつかぬ。", "吾輩は猫である。名前はまだ無い。どこで生れたかとんと見当がつかぬ。" * 3):
+        for chunk_size in (8, 20, 64):
+            chunks = kanji_conv.convert_stream(document, "roman", chunk_size=chunk_size)
+            assert "".join(chunks) == kanji_conv.to_roman(document)
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_get_returns_pooled_instances(mock_dictionary, mock_isfile):
+    """KanjiConv.get shares one instance per configuration and evicts the least recently used."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [MockToken(text)]
+
+    first = KanjiConv.get(separator="/", cache_size=8)
+    assert KanjiConv.get(cache_size=8, separator="/") is first
+    assert KanjiConv.get(separator=" ") is not first
+    assert first.to_roman("カ") == "ka"
+    assert mock_dictionary.call_count == 1  # The tokenizer is shared between pooled instances.
+
+    stats = KanjiConv.pool_stats()
+    assert (stats["instances"], stats["hits"], stats["misses"]) == (2, 1, 2)
+    assert (stats["dictionaries"], stats["tokenizers"]) == (1, 1)
+    assert stats["memory"]["result_cache_bytes"] > 0
+
+    KanjiConv.pool_resize(1)
+    assert KanjiConv.pool_stats()["evictions"] == 1
+    assert first.cache_info().currsize == 0  # Evicted instances are closed.
+    assert KanjiConv.get(separator="/", cache_size=8) is not first
+    KanjiConv.pool_resize(32)
+
+    KanjiConv.pool_clear()
+    assert KanjiConv.pool_stats()["instances"] == 0
+
+
+@patch("sudachipy.Dictionary")
+def test_get_builds_instances_outside_the_pool_lock(mock_dictionary):
+    """A slow first construction is shared by concurrent callers and does not block other configurations."""
+    slow_started = threading.Event()
+    release = threading.Event()
+    original_init = KanjiConv.__init__
+
+    def init(self, *args, **kwargs):
+        if kwargs.get("separator") == "/":
+            slow_started.set()
+            assert release.wait(5)
+        original_init(self, *args, **kwargs)
+
+    with patch.object(KanjiConv, "__init__", init), ThreadPoolExecutor(max_workers=3) as executor:
+        slow = [executor.submit(KanjiConv.get, separator="/") for _ in range(2)]
+        assert slow_started.wait(5)
+        assert KanjiConv.get(separator=" ").separator == " "  # Not blocked by the slow construction.
+        release.set()
+        assert slow[0].result() is slow[1].result()
+
+    stats = KanjiConv.pool_stats()
+    assert (stats["instances"], stats["hits"], stats["misses"]) == (2, 1, 2)
+
+
+@patch("sudachipy.Dictionary")
+@patch("fugashi.Tagger")
+@patch("kanjiconv.kanjiconv.UNIDIC_AVAILABLE", True)
+def test_unidic_tagger_is_shared(mock_tagger, mock_dictionary):
+    first = KanjiConv(use_unidic=True)
+    second = KanjiConv(use_unidic=True, separator="/")
+    assert first.unidic_tagger is second.unidic_tagger
+    assert mock_tagger.call_count == 1
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_kana_fast_path_skips_tokenizer_with_identical_output(mock_dictionary, mock_isfile):
+    """Kana-only phrases bypass Sudachi when the separator is empty, without changing the output."""
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    readings = {"東京": "トウキョウ"}
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [
+        MockToken(readings.get(part, part.translate({code: code + 0x60 for code in range(0x3041, 0x3097)})), part)
+        for part in re.findall(r"東京|.", text)
+    ]
+    text = "コカコーラ、東京。ひらがな ア！"
+
+    fast = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="")
+    fast.custom_readings = {"single": {"ア": ["カ"]}, "compound": {}}
+    slow = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="", kana_fast_path=False)
+    slow.custom_readings = fast.custom_readings
+    for mode in ("hiragana", "katakana", "roman"):
+        assert getattr(fast, f"to_{mode}")(text) == getattr(slow, f"to_{mode}")(text)
+
+    mock_tokenizer.tokenize.reset_mock()
+    assert fast.to_katakana(text) == "コカコーラ、トウキョウ。ヒラガナ カ！"
+    # Only the kanji phrase and the phrase with a custom reading ("ア") reach Sudachi.
+    assert [call.args[0] for call in mock_tokenizer.tokenize.call_args_list] == ["、東京。", " ア！"]
+    assert fast.stats()["fast_path"]["chars"] == 4 * len("コカコーラひらがな")
+    assert 0 < fast.stats()["fast_path"]["fraction"] < 1
+    assert slow.stats()["fast_path"]["chars"] == 0
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_kana_fast_path_leaves_kana_sudachi_normalizes_to_sudachi(mock_dictionary, mock_isfile):
+    """Kana whose Sudachi reading differs from the surface never take the fast path."""
+    # Readings as returned by Sudachi (core dictionary) for phrases it normalizes.
+    sudachi_readings = {"すごーーーい": "スゴーイ", "ヱビス": "エビス", "ゐる": "イル", "ヶ": "ケ", "ゔぁ": "ゔぁ"}
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [
+        MockToken(sudachi_readings.get(part, part), part) for part in re.findall(r"[^、！]+|.", text)
+    ]
+    text = "すごーーーい！ヱビス、ゐる、ヶ、ゔぁ"
+
+    fast = KanjiConv(sudachi_dict_type=SudachiDictType.FULL.value, separator="", use_custom_readings=False)
+    slow = KanjiConv(
+        sudachi_dict_type=SudachiDictType.FULL.value, separator="", use_custom_readings=False, kana_fast_path=False
+    )
+    for mode in ("hiragana", "katakana", "roman"):
+        assert getattr(fast, f"to_{mode}")(text) == getattr(slow, f"to_{mode}")(text)
+    assert fast.to_katakana(text) == "スゴーイ！エビス、イル、ケ、ゔぁ"
+    assert fast.stats()["fast_path"]["chars"] == 0
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_kana_fast_path_leaves_small_vowels_to_sudachi(mock_dictionary, mock_isfile):
+    """Sudachi reads small vowels after kana as long vowels or drops them, so they are not fast-pathed."""
+    sudachi_readings = {"ねェ": "ネー", "まァ": "マー", "だよなァ": "ダヨナ", "ぁ": "ァ", "くゎし": "クヮシ"}
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.side_effect = lambda text, mode: [
+        MockToken(sudachi_readings.get(part, part), part) for part in re.findall(r"[^、]+|.", text)
+    ]
+    text = "ねェ、まァ、だよなァ、ぁ、くゎし"
+
+    fast = KanjiConv(separator="", use_custom_readings=False)
+    slow = KanjiConv(separator="", use_custom_readings=False, kana_fast_path=False)
+    for mode in ("hiragana", "katakana", "roman"):
+        assert getattr(fast, f"to_{mode}")(text) == getattr(slow, f"to_{mode}")(text)
+    assert fast.to_roman("ねェ") == "nee"
+    assert fast.to_katakana("だよなァ") == "ダヨナ"
+    assert fast.stats()["fast_path"]["chars"] == 0
+    assert slow.stats()["fast_path"]["total_chars"] == 0  # Nothing is counted when the fast path is off.
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_context_selects_single_reading(mock_dictionary, mock_isfile):
+    class PosToken(MockToken):
+        def __init__(self, reading, surface, pos):
+            super().__init__(reading, surface)
+            self._pos = pos
+
+        def part_of_speech(self):
+            return (self._pos, "*", "*", "*", "*", "*")
+
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    kanji_conv = KanjiConv(separator="/")
+    kanji_conv.custom_readings = {
+        "single": {"生": ["セイ", "ショウ", "イ", "ウ"]},
+        "compound": {},
+        "context": {"生": {"next": {"き": "イ", "ま": "ウ"}, "prev": {"一": "ショウ"}, "pos": {"動詞": "イ"}}},
+    }
+
+    mock_tokenizer.tokenize.return_value = [PosToken("", "生", "動詞"), MockToken("キル", "きる")]
+    assert kanji_conv.to_hiragana("生きる") == "い/きる"
+    mock_tokenizer.tokenize.return_value = [MockToken("イチ", "一"), PosToken("", "生", "名詞")]
+    assert kanji_conv.to_hiragana("一生") == "いち/しょう"
+    # Tied votes go to the earlier candidate; no vote falls back to the first one.
+    mock_tokenizer.tokenize.return_value = [PosToken("", "生", "動詞"), MockToken("マレ", "まれ")]
+    assert kanji_conv.to_hiragana("生まれ") == "い/まれ"
+    mock_tokenizer.tokenize.return_value = [PosToken("", "生", "名詞")]
+    assert kanji_conv.to_hiragana("生") == "せい"
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,136 @@
+import json
+import pickle
+import random
+from unittest.mock import patch
+
+import pytest
+
+from kanjiconv.cli import main
+from kanjiconv.kanjiconv import KanjiConv, _CompoundMatcher
+from kanjiconv.readings_index import _MappedTable, compile_readings, load_readings_index
+
+from .conftest import MockToken
+
+
+@pytest.fixture
+def readings_json(tmp_path):
+    path = tmp_path / "readings.json"
+    path.write_text(
+        json.dumps(
+            {
+                "single": {"生": ["セイ", "ショウ"], "檄": ["ゲキ"]},
+                "compound": {"激を飛ばす": "げきをとばす", "飛ばす": "とばす"},
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_compile_and_load_json(readings_json, tmp_path):
+    index_path = tmp_path / "readings.idx"
+    compile_readings(readings_json, index_path)
+
+    index = load_readings_index(index_path)
+    assert index is load_readings_index(str(index_path))
+    assert dict(index.single) == {"檄": ["ゲキ"], "生": ["セイ", "ショウ"]}
+    assert dict(index.compound) == {"激を飛ばす": "げきをとばす", "飛ばす": "とばす"}
+    assert "飛" not in index.compound
+    with pytest.raises(KeyError):
+        index.compound["飛"]
+
+
+def test_load_sees_recompiled_index(tmp_path):
+    source = tmp_path / "readings.tsv"
+    index_path = tmp_path / "readings.idx"
+    source.write_text("東京\tとうきょう\n", encoding="utf-8")
+    compile_readings(source, index_path)
+    assert dict(load_readings_index(index_path).compound) == {"東京": "とうきょう"}
+
+    source.write_text("大阪\tおおさか\n", encoding="utf-8")
+    compile_readings(source, index_path)
+    assert dict(load_readings_index(index_path).compound) == {"大阪": "おおさか"}
+
+
+def test_compile_tsv(tmp_path):
+    source = tmp_path / "readings.tsv"
+    source.write_text("# surface\treading\n生\tセイ\tショウ\n\n激を飛ばす\tげきをとばす\n", encoding="utf-8")
+    index_path = tmp_path / "readings.idx"
+    compile_readings(source, index_path)
+
+    index = load_readings_index(index_path)
+    assert dict(index.single) == {"生": ["セイ", "ショウ"]}
+    assert dict(index.compound) == {"激を飛ばす": "げきをとばす"}
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "not-an-index"
+    path.write_bytes(b"hello world")
+    with pytest.raises(ValueError):
+        load_readings_index(path)
+
+
+@patch("os.path.isfile", return_value=True)
+@patch("sudachipy.Dictionary")
+def test_kanjiconv_uses_index_with_per_instance_overlay(mock_dictionary, mock_isfile, readings_json, tmp_path):
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [MockToken("", "生")]
+    index_path = tmp_path / "readings.idx"
+    compile_readings(readings_json, index_path)
+
+    first = KanjiConv(readings_index=index_path, separator="")
+    second = KanjiConv(readings_index=index_path, separator="")
+    assert first.to_hiragana("生") == "せい"
+    first.to_hiragana("激を飛ばす")
+    assert mock_tokenizer.tokenize.call_args[0][0] == "げきをとばす"
+
+    # Edits stay in the editing instance; the mapped tables are shared, not copied.
+    first.custom_readings["single"]["生"] = ["ナマ"]
+    del first.custom_readings["compound"]["激を飛ばす"]
+    assert first.to_hiragana("生") == "なま"
+    assert second.to_hiragana("生") == "せい"
+    first.to_hiragana("激を飛ばす")
+    assert mock_tokenizer.tokenize.call_args[0][0] == "激をとばす"
+    assert second.custom_readings["compound"].base is first.custom_readings["compound"].base
+
+
+def test_compounds_are_matched_in_the_mapped_index(tmp_path):
+    rng = random.Random(0)
+    compounds = {"".join(rng.choice("東京都大阪府") for _ in range(rng.randint(1, 4))): "よみ" for _ in range(200)}
+    source = tmp_path / "readings.json"
+    source.write_text(json.dumps({"compound": compounds}, ensure_ascii=False), encoding="utf-8")
+    index_path = tmp_path / "readings.idx"
+    compile_readings(source, index_path)
+
+    kanji_conv = KanjiConv(readings_index=index_path)
+    overlay = kanji_conv.custom_readings["compound"]
+    text = "".join(rng.choice("東京都大阪府の") for _ in range(500))
+    # The index is searched in place, never iterated into a trie, with the instance's own edits on top.
+    with patch.object(_MappedTable, "__iter__", side_effect=AssertionError("index copied")):
+        shared = list(kanji_conv._get_compound_matcher().finditer(text))
+        overlay["京都大阪"] = "けいはんしん"
+        del overlay[next(iter(compounds))]
+        edited = list(kanji_conv._get_compound_matcher().finditer(text))
+    assert shared == list(_CompoundMatcher(compounds).finditer(text))
+    assert edited == list(_CompoundMatcher(dict(overlay)).finditer(text))
+
+
+def test_worker_config_pickles_index_by_reference(readings_json, tmp_path):
+    index_path = tmp_path / "readings.idx"
+    compile_readings(readings_json, index_path)
+    kanji_conv = KanjiConv(readings_index=index_path)
+    kanji_conv.custom_readings["compound"]["檄"] = "げき"
+
+    kwargs, custom_readings = pickle.loads(pickle.dumps(kanji_conv._worker_config()))
+    compound = custom_readings["compound"]
+    assert compound.base is load_readings_index(index_path).compound
+    assert compound["檄"] == "げき"
+    assert compound["飛ばす"] == "とばす"
+    assert len(pickle.dumps(custom_readings)) < 1024
+
+
+def test_cli_compile_readings(readings_json, tmp_path):
+    index_path = tmp_path / "cli.idx"
+    assert main(["compile-readings", str(readings_json), "-o", str(index_path)]) == 0
+    assert load_readings_index(index_path).compound["飛ばす"] == "とばす"
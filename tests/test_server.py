@@ -0,0 +1,128 @@
+import io
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix-domain sockets")
+
+
+class FakeKanjiConv:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.tokenizer = None
+        FakeKanjiConv.instances.append(self)
+
+    def convert_many(self, texts, modes):
+        for text in texts:
+            yield {mode: f"{mode}:{self.kwargs['separator']}:{text}" for mode in modes}
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    from kanjiconv import server
+
+    # Keep the path short: Unix-domain socket paths are limited to about 100 bytes.
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="kc"), "d.sock")
+    monkeypatch.setenv("KANJICONV_SOCKET", socket_path)
+    FakeKanjiConv.instances = []
+
+    with patch.object(server, "KanjiConv", FakeKanjiConv):
+        conversion_server = server._ConversionServer(socket_path, "core")
+        thread = threading.Thread(target=conversion_server.serve_forever, daemon=True)
+        thread.start()
+        yield socket_path
+        conversion_server.shutdown()
+        conversion_server.server_close()
+        os.unlink(socket_path)
+
+
+def test_client_converts_through_daemon_and_reuses_converters(daemon):
+    from kanjiconv.server import connect
+
+    with connect() as client:
+        assert client.convert(["東京", "大阪"], "roman") == ["roman: :東京", "roman: :大阪"]
+        assert client.convert(["東京"], "hiragana", separator="/") == ["hiragana:/:東京"]
+        assert client.convert(["東京"], "katakana") == ["katakana: :東京"]
+        with pytest.raises(RuntimeError, match="Invalid mode"):
+            client.convert(["東京"], "kanji")
+
+        assert client.convert(["東京"], "roman", dict_type="core") == ["roman: :東京"]
+
+    assert len(FakeKanjiConv.instances) == 3
+    assert FakeKanjiConv.instances[0].kwargs["sudachi_split_mode"] == "C"
+    # Requests get the dictionary they name (full by default), not the one the daemon preloaded.
+    assert [instance.kwargs["sudachi_dict_type"] for instance in FakeKanjiConv.instances] == ["full", "full", "core"]
+
+
+def test_daemon_keeps_a_bounded_number_of_converters(daemon):
+    from kanjiconv import server
+
+    with server.connect() as client:
+        for i in range(server._MAX_CONVERTERS + 4):
+            assert client.convert(["東京"], "roman", separator=str(i)) == [f"roman:{i}:東京"]
+        assert client.convert(["東京"], "roman", separator="0") == ["roman:0:東京"]
+
+    # Each new separator builds a converter; the oldest ones are evicted and rebuilt on demand.
+    assert len(FakeKanjiConv.instances) == server._MAX_CONVERTERS + 5
+
+
+def test_connect_returns_none_without_daemon(tmp_path):
+    from kanjiconv.server import connect
+
+    assert connect(str(tmp_path / "missing.sock")) is None
+
+
+@patch("kanjiconv.cli.KanjiConv")
+def test_cli_uses_running_daemon(mock_kanji_conv, daemon):
+    from kanjiconv.cli import main
+
+    stdout = io.StringIO()
+    with patch.object(sys, "stdout", stdout), patch.object(sys, "stdin", io.StringIO("一\n二\n")):
+        assert main(["東京", "-m", "hiragana"]) == 0
+        assert main(["-m", "katakana"]) == 0
+
+    assert stdout.getvalue() == "hiragana: :東京\nkatakana: :一\nkatakana: :二\n"
+    mock_kanji_conv.assert_not_called()
+
+    stdout = io.StringIO()
+    mock_kanji_conv.return_value.to_roman.return_value = "toukyou"
+    with patch.object(sys, "stdout", stdout):
+        assert main(["東京", "--no-daemon"]) == 0
+    assert stdout.getvalue() == "toukyou\n"
+
+
+def test_daemon_socket_is_private_and_shared_sockets_are_ignored(daemon):
+    from kanjiconv.server import connect
+
+    assert stat.S_IMODE(os.stat(daemon).st_mode) == 0o600
+
+    # A socket other users can reach, or one in a directory they can modify, might not be ours.
+    os.chmod(daemon, 0o666)
+    assert connect() is None
+    os.chmod(daemon, 0o600)
+    os.chmod(os.path.dirname(daemon), 0o777)
+    try:
+        assert connect() is None
+    finally:
+        os.chmod(os.path.dirname(daemon), 0o700)
+
+    with connect() as client:
+        assert client.convert(["東京"], "roman") == ["roman: :東京"]
+
+
+def test_default_socket_path_is_in_a_private_directory(monkeypatch, tmp_path):
+    from kanjiconv.server import default_socket_path
+
+    monkeypatch.delenv("KANJICONV_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path / "kanjiconv.sock")
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    assert os.path.basename(os.path.dirname(default_socket_path())) == f"kanjiconv-{os.getuid()}"
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+from kanjiconv.kanjiconv import KanjiConv
+from kanjiconv.snapshot import build_snapshot, load_snapshot
+
+
+@pytest.fixture
+def readings():
+    return {"東京": "トウキョウ", "新宿": "シンジュク", "渋谷": "シブヤ"}
+
+
+def test_snapshot_answers_known_texts_without_sudachi(mock_tokenizer, tmp_path):
+    path = tmp_path / "stations.snap"
+    assert build_snapshot(["東京", "新宿", "東京"], path, KanjiConv(separator="/")) == 2
+    assert len(load_snapshot(path)) == 2
+
+    kanji_conv = KanjiConv(separator="/", snapshot=path)
+    mock_tokenizer.tokenize.reset_mock()
+    assert kanji_conv.to_hiragana("東京") == "とうきょう"
+    assert kanji_conv.to_roman("新宿") == "shinjuku"
+    mock_tokenizer.tokenize.assert_not_called()
+
+    # Texts outside the snapshot still go through Sudachi.
+    assert kanji_conv.to_hiragana("渋谷") == "しぶや"
+    assert mock_tokenizer.tokenize.call_count == 1
+
+
+def test_stale_snapshot_is_rejected(mock_tokenizer, tmp_path):
+    path = tmp_path / "stations.snap"
+    build_snapshot(["東京"], path, KanjiConv(separator="/"))
+
+    for settings in (
+        {"separator": ""},
+        {"separator": "/", "sudachi_split_mode": "A"},
+        {"separator": "/", "use_custom_readings": False},
+    ):
+        with pytest.raises(ValueError, match="different settings"):
+            KanjiConv(snapshot=path, **settings)
+
+    # Editing the custom readings afterwards stops the snapshot from being consulted.
+    kanji_conv = KanjiConv(separator="/", snapshot=path)
+    kanji_conv.custom_readings["compound"]["東京"] = "ひがしきょう"
+    mock_tokenizer.tokenize.reset_mock()
+    kanji_conv.to_hiragana("東京")
+    assert mock_tokenizer.tokenize.call_count == 1
+    assert kanji_conv._worker_config()[0]["snapshot"] is None
+
+
+def test_snapshot_is_rejected_after_system_dictionary_upgrade(mock_tokenizer, tmp_path):
+    system = tmp_path / "system.dic"
+    system.write_bytes(b"system")
+    path = tmp_path / "stations.snap"
+
+    with patch("kanjiconv.user_dict._system_dictionary_path", return_value=system):
+        build_snapshot(["東京"], path, KanjiConv(separator="/"))
+        assert KanjiConv(separator="/", snapshot=path).to_hiragana("東京") == "とうきょう"
+
+        system.write_bytes(b"upgraded system")
+        with pytest.raises(ValueError, match="different settings"):
+            KanjiConv(separator="/", snapshot=path)
+
+
+def test_load_snapshot_sees_rebuilt_snapshot(mock_tokenizer, tmp_path):
+    path = tmp_path / "stations.snap"
+    build_snapshot(["東京"], path, KanjiConv(separator="/"))
+    assert load_snapshot(path).get("新宿") is None
+
+    build_snapshot(["東京", "新宿"], path, KanjiConv(separator="/"))
+    assert load_snapshot(path).get("新宿") == "シンジュク"
+    assert KanjiConv(separator="/", snapshot=path).to_hiragana("新宿") == "しんじゅく"
+
+
+def test_load_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"KCRIDX\x00\x01")
+    with pytest.raises(ValueError, match="not a kanjiconv snapshot"):
+        load_snapshot(path)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Modules that must only be imported when a conversion (or async/parallel API) needs them.
+HEAVY_MODULES = ["sudachipy", "fugashi", "unidic", "asyncio", "multiprocessing", "concurrent.futures.process"]
+
+
+@pytest.mark.parametrize("module", ["kanjiconv", "kanjiconv.cli"])
+def test_import_does_not_load_heavy_dependencies(module: str) -> None:
+    """Importing the package (e.g. for `kanjiconv --help`) must not load the tokenizer backends."""
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,157 @@
+import csv
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from kanjiconv.entities import TokenSource
+from kanjiconv.kanjiconv import KanjiConv
+from kanjiconv.user_dict import _noun_connection_ids, _system_dictionary_path, _word_connection_ids, build_user_dict
+
+
+class MockMorpheme:
+    def __init__(self, reading, surface, dictionary_id=0, part_of_speech=(), word_id=0):
+        self._reading = reading
+        self._surface = surface
+        self._dictionary_id = dictionary_id
+        self._part_of_speech = part_of_speech
+        self._word_id = word_id
+
+    def reading_form(self):
+        return self._reading
+
+    def surface(self):
+        return self._surface
+
+    def dictionary_id(self):
+        return self._dictionary_id
+
+    def part_of_speech(self):
+        return self._part_of_speech
+
+    def word_id(self):
+        return self._word_id
+
+
+def system_dic_bytes(word_params, left_size=8, right_size=8):
+    """A system dictionary laid out up to its word parameter table, with one part of speech."""
+    data = bytearray(272)
+    data += struct.pack("<H", 1)
+    for field in ("名詞", "普通名詞", "一般", "*", "*", "*"):
+        data += bytes([len(field)]) + field.encode("utf-16-le")
+    data += struct.pack("<hh", left_size, right_size) + bytes(2 * left_size * right_size)
+    data += struct.pack("<I", 2) + bytes(8)  # trie
+    data += struct.pack("<I", 3) + bytes(3)  # word id table
+    data += struct.pack("<I", len(word_params))
+    for params in word_params:
+        data += struct.pack("<hhh", *params)
+    return bytes(data)
+
+
+@pytest.fixture
+def sudachi_build(tmp_path):
+    """Patch the Sudachi system dictionary lookup and user dictionary builder."""
+    system = tmp_path / "system.dic"
+    system.write_bytes(b"system")
+    lexicons = []
+
+    def build_user_dic(system, lex, output, description):
+        with open(lex[0], encoding="utf-8", newline="") as f:
+            lexicons.append(list(csv.reader(f)))
+        output.write_bytes(b"user")
+        return []
+
+    with patch("kanjiconv.user_dict._system_dictionary_path", return_value=system), patch(
+        "kanjiconv.user_dict._noun_connection_ids", return_value=(5, 6)
+    ), patch("sudachipy.sudachipy.build_user_dic", side_effect=build_user_dic) as mock_build:
+        mock_build.lexicons = lexicons
+        yield mock_build
+
+
+def test_build_user_dict_caches_by_content(sudachi_build, tmp_path):
+    source = tmp_path / "words.csv"
+    source.write_text("# surface,reading\n激を飛ばす,げきをとばす\nＡＩ,エーアイ\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    path = build_user_dict([source], cache_dir=cache_dir)
+    assert build_user_dict([source], cache_dir=cache_dir) == path
+    assert sudachi_build.call_count == 1
+
+    rows = sudachi_build.lexicons[0]
+    assert rows[0][0] == "激を飛ばす"
+    assert rows[0][1:4] == ["5", "6", "-10000"]
+    assert rows[0][11] == "ゲキヲトバス"
+    assert rows[1][0] == "ai"
+    assert rows[1][4] == "ＡＩ"
+    assert all(len(row) == 18 for row in rows)
+
+    source.write_text("激を飛ばす,げきをとばす\n", encoding="utf-8")
+    assert build_user_dict([source], cache_dir=cache_dir) != path
+    assert sudachi_build.call_count == 2
+
+
+def test_build_user_dict_rejects_rows_without_reading(sudachi_build, tmp_path):
+    source = tmp_path / "words.csv"
+    source.write_text("激を飛ばす\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        build_user_dict([source], cache_dir=tmp_path / "cache")
+
+
+def test_noun_connection_ids_are_read_from_the_system_dictionary(tmp_path):
+    system = tmp_path / "system.dic"
+    system.write_bytes(system_dic_bytes([(1, 1, 100), (3, 4, 200)]))
+    proper_noun = ("名詞", "固有名詞", "一般", "*", "*", "*")
+    common_noun = ("名詞", "普通名詞", "一般", "*", "*", "*")
+    morphemes = {
+        "机": [MockMorpheme("ツクエ", "机", part_of_speech=proper_noun, word_id=0)],
+        "猫": [MockMorpheme("ネコ", "猫", part_of_speech=common_noun, word_id=1)],
+    }
+
+    with patch("sudachipy.Dictionary") as mock_dictionary:
+        mock_dictionary.return_value.create.return_value.tokenize.side_effect = lambda text: morphemes.get(text, [])
+        assert _noun_connection_ids(system) == (3, 4)
+    assert mock_dictionary.call_args.kwargs["dict"] == str(system)
+
+
+def test_word_connection_ids_are_validated(tmp_path):
+    system = tmp_path / "system.dic"
+    system.write_bytes(system_dic_bytes([(1, 1, 100), (9, 4, 200)]))
+
+    assert _word_connection_ids(system, 0) == (1, 1)
+    with pytest.raises(ValueError, match="connection matrix"):
+        _word_connection_ids(system, 1)
+    with pytest.raises(ValueError, match="outside the lexicon"):
+        _word_connection_ids(system, 2)
+
+
+def test_system_dictionary_path_accepts_files_and_packages(tmp_path):
+    system = tmp_path / "system.dic"
+    system.write_bytes(b"system")
+
+    assert _system_dictionary_path(str(system)) == system
+    with pytest.raises(ModuleNotFoundError, match="pip install sudachidict_missing"):
+        _system_dictionary_path("missing")
+
+
+@patch("sudachipy.config.Config")
+@patch("sudachipy.Dictionary")
+def test_kanjiconv_loads_user_dict_into_sudachi(mock_dictionary, mock_config, sudachi_build, tmp_path, monkeypatch):
+    monkeypatch.setenv("KANJICONV_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "words.csv"
+    source.write_text("激を飛ばす,げきをとばす\n", encoding="utf-8")
+    mock_tokenizer = mock_dictionary.return_value.create.return_value
+    mock_tokenizer.tokenize.return_value = [
+        MockMorpheme("ゲキヲトバス", "激を飛ばす", dictionary_id=1),
+        MockMorpheme("", "！"),
+    ]
+
+    kanji_conv = KanjiConv(separator="/", use_custom_readings=False, user_dict=source)
+    tokens = kanji_conv.tokenize("激を飛ばす！")
+
+    assert [token.source for token in tokens] == [TokenSource.CUSTOM, TokenSource.PASSTHROUGH]
+    assert kanji_conv.to_hiragana("激を飛ばす！") == "げきをとばす/！"
+    (user_paths,) = (call.kwargs["user"] for call in mock_config.call_args_list)
+    assert user_paths[0].startswith(str(tmp_path / "cache"))
+    assert mock_dictionary.call_args.kwargs["config"] is mock_config.return_value
+    assert sudachi_build.call_count == 1
+    assert kanji_conv._worker_config()[0]["user_dict"] == [str(source)]